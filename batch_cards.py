@@ -0,0 +1,133 @@
+# Batch card renderer: renders hitter cards for many players across a process pool.
+#
+# Examples:
+#   python batch_cards.py --ids 592450 665742 --season 2024
+#   python batch_cards.py --team NYY --season 2024 --start 2024-06-01 --end 2024-06-30
+#   python batch_cards.py --qualified --season 2024 --workers 8 --statcast-workers 4
+
+import matplotlib as mpl
+mpl.use('Agg')  # Headless rendering; must be set before pyplot is imported
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from constants import SEASON_DATES, GAME_TYPE_WINDOWS, STATCAST_MAX_WORKERS
+from plotting import make_batter_card, BatterCardTemplate
+from utils import get_team_hitters, prefetch_team_logos, set_statcast_concurrency
+from data_processing import load_league_stats
+
+
+# Card template reused by every card this worker process renders
+_template = None
+
+def render_card(player_id: int, game_type: str, start_date: str, end_date: str,
+                season: int, out_dir: str, dpi: int, image_format: str = 'png') -> str:
+    """
+    Render one player's card to an image file.
+
+    Args:
+        player_id (int): The player's MLB ID.
+        game_type (str): The game type.
+        start_date (str): Start date in "YYYY-MM-DD" format.
+        end_date (str): End date in "YYYY-MM-DD" format.
+        season (int): The season year.
+        out_dir (str): Directory to write the card to.
+        dpi (int): Output resolution.
+        image_format (str): 'png' or 'webp'.
+
+    Returns:
+        str: The path of the rendered card.
+    """
+    global _template
+    if _template is None:
+        _template = BatterCardTemplate()
+
+    path = os.path.join(out_dir, f'{player_id}_{season}_{start_date}_{end_date}.{image_format}')
+
+    card = make_batter_card(player_id, game_type=game_type, start_date=start_date,
+                            end_date=end_date, season=season, output=image_format, dpi=dpi,
+                            template=_template)
+    with open(path, 'wb') as f:
+        f.write(card)
+
+    return path
+
+def get_player_ids(args: argparse.Namespace) -> list:
+    """
+    Collect the MLB IDs to render from the command line arguments.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        list: Unique MLB IDs, in the order given.
+    """
+    player_ids = list(args.ids or [])
+    if args.team:
+        player_ids += get_team_hitters(args.team, args.season)
+    if args.qualified:
+        player_ids += load_league_stats(args.season)['player_id'].tolist()
+
+    return list(dict.fromkeys(int(player_id) for player_id in player_ids))
+
+def main():
+    parser = argparse.ArgumentParser(description="Render hitter cards for many players in parallel.")
+    parser.add_argument('--ids', nargs='+', type=int, help="MLB IDs of the players to render")
+    parser.add_argument('--team', help="Render every position player on this team (e.g. NYY)")
+    parser.add_argument('--qualified', action='store_true',
+                        help="Render every hitter in data/clean{season}.csv")
+    parser.add_argument('--season', type=int, default=2024, help="Season year")
+    parser.add_argument('--game-type', default='R', choices=list(GAME_TYPE_WINDOWS), help="Game type")
+    parser.add_argument('--start', help="Start date (YYYY-MM-DD), defaults to the start of the game type's window")
+    parser.add_argument('--end', help="End date (YYYY-MM-DD), defaults to the end of the game type's window")
+    parser.add_argument('--out', default='cards', help="Output directory")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of render processes")
+    parser.add_argument('--statcast-workers', type=int, default=STATCAST_MAX_WORKERS,
+                        help="Statcast downloads in flight across all render processes (at least one per process)")
+    parser.add_argument('--dpi', type=int, default=300, help="Output resolution")
+    parser.add_argument('--format', choices=['png', 'webp'], default='png', help="Output image format")
+    args = parser.parse_args()
+
+    # Default to the season window that matches the game type
+    if (not args.start or not args.end) and args.season not in SEASON_DATES:
+        parser.error(f"No season dates for {args.season}; pass --start and --end")
+    start_key, end_key = GAME_TYPE_WINDOWS[args.game_type]
+    start_date = args.start or SEASON_DATES[args.season][start_key]
+    end_date = args.end or SEASON_DATES[args.season][end_key]
+
+    player_ids = get_player_ids(args)
+    if not player_ids:
+        parser.error("No players to render; pass --ids, --team or --qualified")
+
+    os.makedirs(args.out, exist_ok=True)
+
+    # Warm the logo cache once so the workers share it
+    prefetch_team_logos()
+
+    # Split the Statcast download budget between the workers, so the pool as a whole
+    # doesn't multiply it by the worker count
+    statcast_per_worker = max(1, args.statcast_workers // args.workers)
+
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=set_statcast_concurrency,
+                             initargs=(statcast_per_worker,)) as executor:
+        futures = {
+            executor.submit(render_card, player_id, args.game_type, start_date, end_date,
+                            args.season, args.out, args.dpi, args.format): player_id
+            for player_id in player_ids
+        }
+        for future in as_completed(futures):
+            player_id = futures[future]
+            try:
+                print(f"Rendered {future.result()}")
+            except Exception as e:
+                failures += 1
+                print(f"Failed to render card for player ID {player_id}: {e}")
+
+    print(f"Rendered {len(player_ids) - failures}/{len(player_ids)} cards to {args.out}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == '__main__':
+    main()
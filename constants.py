@@ -109,6 +109,79 @@ SEASON_DATES = {
     }
 }
 
+# SEASON_DATES keys of the default date window for each game type
+GAME_TYPE_WINDOWS = {
+    'R': ('REG_START', 'REG_END'),
+    'P': ('POST_START', 'POST_END'),
+    'D': ('POST_START', 'POST_END'),
+    'L': ('POST_START', 'POST_END'),
+    'W': ('POST_START', 'POST_END'),
+    'S': ('SPRING_START', 'SPRING_END'),
+    '1H': ('FH_START', 'FH_END'),
+    '2H': ('SH_START', 'SH_END')
+}
+
+# Local Statcast pitch cache (Parquet, partitioned by season and player)
+STATCAST_CACHE_DIR = 'data/statcast_cache'
+STATCAST_FRESHNESS_HOURS = 12  # How long cached recent dates of an in-progress season stay valid
+STATCAST_SETTLE_DAYS = 3  # Dates fetched at least this many days after the game are final
+
+# In-memory season game log cache
+GAME_LOG_FRESHNESS_HOURS = 1  # How long a cached in-progress season game log stays valid
+
+# Game log columns and the stats API gameLog fields they are parsed from
+GAME_LOG_FIELDS = {
+    'G': 'gamesPlayed', 'PA': 'plateAppearances', 'AB': 'atBats', 'H': 'hits', '2B': 'doubles',
+    '3B': 'triples', 'HR': 'homeRuns', 'R': 'runs', 'RBI': 'rbi', 'IBB': 'intentionalWalks',
+    'BB': 'baseOnBalls', 'SO': 'strikeOuts', 'HBP': 'hitByPitch', 'SB': 'stolenBases',
+    'CS': 'caughtStealing', 'SF': 'sacFlies'
+}
+
+# Bulk game log downloads
+GAME_LOG_BULK_CHUNK_SIZE = 50  # Players hydrated per people request
+GAME_LOG_MAX_WORKERS = 8  # Requests in flight at once
+
+# Statcast columns kept in the compact pitch frame, and their dtypes
+STATCAST_COLUMNS = {
+    'batter': 'int32',
+    'game_date': 'str',  # "YYYY-MM-DD"
+    'game_pk': 'int32',
+    'at_bat_number': 'int16',
+    'pitch_number': 'int8',
+    'events': 'category',
+    'description': 'category',
+    'zone': 'float32',  # Missing on some pitches
+    'launch_speed': 'float32',
+    'launch_angle': 'float32',
+    'estimated_ba_using_speedangle': 'float32',
+    'estimated_slg_using_speedangle': 'float32',
+    'estimated_woba_using_speedangle': 'float32'
+}
+
+# Player name search index source (one row per player, keyed by MLBID)
+PLAYER_ID_MAP_PATH = 'data/player_id_map.csv'
+PLAYER_SEARCH_MIN_SIMILARITY = 0.3  # Trigram similarity below which fuzzy matches are dropped
+
+# Memory-mapped league Statcast store (one Arrow IPC file per season, sorted by batter then date)
+LEAGUE_STATCAST_DIR = 'data/league_statcast'
+
+# Concurrent Statcast downloads
+STATCAST_MAX_WORKERS = 6  # Month chunks downloaded at once
+STATCAST_MAX_RETRIES = 3  # Attempts per chunk before giving up
+STATCAST_BACKOFF_SECONDS = 1  # Initial retry delay, doubled after each failure
+
+# HTTP client settings for MLB API and image requests
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+HTTP_MAX_RETRIES = 3  # Retries on connection errors, 429 and 5xx responses
+HTTP_BACKOFF_FACTOR = 0.5  # Retry delays of 0.5s, 1s, 2s, ...
+HTTP_RETRY_STATUSES = [429, 500, 502, 503, 504]
+HTTP_POOL_SIZE = 16  # Keep-alive connections kept per host
+HTTP_MAX_CONCURRENCY_PER_HOST = 8  # Requests in flight per host at once
+
+# Headshot and team logo image cache
+IMAGE_CACHE_DIR = 'data/image_cache'
+IMAGE_CACHE_MAX_BYTES = 32 * 1024 ** 2  # Decoded bytes of the images kept in memory (LRU)
+IMAGE_MAX_SIZE = (640, 640)  # Images are downscaled to fit before caching
 
 # API endpoints
 MLB_API_URL = 'https://statsapi.mlb.com/api/v1/people'
@@ -124,6 +197,20 @@ BIP_EVENTS = [
 SWING_CODE = ['foul', 'hit_into_play', 'swinging_strike', 'foul_tip', 'swinging_strike_blocked', 'foul_bunt']
 WHIFF_CODE = ['swinging_strike', 'foul_tip', 'swinging_strike_blocked']
 
+# Exit velocity sketch bin width (mph); Statcast reports launch speed to 0.1 mph
+EV_SKETCH_RESOLUTION = 0.1
+
+# Barrel zone: launch angle bounds for each 1 mph launch speed band from 97.5 mph up
+BARREL_MIN_SPEED = 97.5
+BARREL_LOWER_ANGLES = [26, 25, 24, 23, 22, 21, 20, 19, 18, 17, 16, 15, 14, 13, 12, 11, 10, 9, 8]
+BARREL_UPPER_ANGLES = [30, 31, 33, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50]
+
+# Sweet spot launch angle range [lower, upper)
+SWEET_SPOT_ANGLES = (8, 32)
+
+# Percentile metrics where a lower value is better
+LOWER_IS_BETTER = ['Whiff%', 'O-Swing%']
+
 # Baseball Savant percentile colors (RGB values)
 PERCENTILE_COLORS = {
     'blue': (50/255, 90/255, 161/255),   # #325aa1 (1st percentile)
@@ -195,6 +282,40 @@ TEAM_COLORS = {
     '120': '#AB0003'   # WSH
 }
 
+# Team abbreviations (matching MLB_TEAM_LOGOS keys)
+TEAM_ABBREVIATIONS = {
+    '109': 'AZ',
+    '144': 'ATL',
+    '110': 'BAL',
+    '111': 'BOS',
+    '112': 'CHC',
+    '145': 'CWS',
+    '113': 'CIN',
+    '114': 'CLE',
+    '115': 'COL',
+    '116': 'DET',
+    '117': 'HOU',
+    '118': 'KC',
+    '108': 'LAA',
+    '119': 'LAD',
+    '146': 'MIA',
+    '158': 'MIL',
+    '142': 'MIN',
+    '121': 'NYM',
+    '147': 'NYY',
+    '133': 'OAK',
+    '143': 'PHI',
+    '134': 'PIT',
+    '135': 'SD',
+    '137': 'SF',
+    '136': 'SEA',
+    '138': 'STL',
+    '139': 'TB',
+    '140': 'TEX',
+    '141': 'TOR',
+    '120': 'WSH'
+}
+
 # MLB Team Logo ESPN URLs
 MLB_TEAM_LOGOS = {
     "AZ": "https://a.espncdn.com/combiner/i?img=/i/teamlogos/mlb/500/scoreboard/ari.png&h=500&w=500",
@@ -1,78 +1,140 @@
+import os
 import pandas as pd
 import numpy as np
-from constants import BIP_EVENTS, SWING_CODE, WHIFF_CODE
-from utils import get_filtered_game_logs
-
-def calculate_xBA(df):
+from constants import (BIP_EVENTS, SWING_CODE, WHIFF_CODE, BARREL_MIN_SPEED,
+                       BARREL_LOWER_ANGLES, BARREL_UPPER_ANGLES, SWEET_SPOT_ANGLES,
+                       LOWER_IS_BETTER, GAME_LOG_FIELDS, EV_SKETCH_RESOLUTION)
+from utils import get_filtered_game_logs, get_pitch_cache_path, update_savant_cache
+
+# Weights for walks and hit-by-pitch in xwOBA
+W_BB = 0.69
+W_HBP = 0.72
+
+# Expected stat -> Statcast column holding its per-ball estimate
+EXPECTED_STAT_COLUMNS = {
+    'xBA': 'estimated_ba_using_speedangle',
+    'xSLG': 'estimated_slg_using_speedangle',
+    'xwOBA': 'estimated_woba_using_speedangle'
+}
+
+# Plate appearance outcomes the expected stats count, by count name
+EXPECTED_STAT_EVENTS = {
+    'SO': ['strikeout', 'strikeout_double_play'],
+    'BB': ['walk'],
+    'HBP': ['hit_by_pitch'],
+    'SF': ['sac_fly']
+}
+
+def count_expected_stat_events(df: pd.DataFrame, by=None) -> pd.DataFrame:
     '''
-    Calculate expected batting average (xBA) for a given DataFrame of Statcast data.
+    Count the events and sum the per-ball estimates every expected stat needs.
+
+    This is the part of count_hitter_events the expected stats use, so calculate_expected_stats
+    doesn't pay for the plate discipline and batted ball counts.
 
     Args:
     - df (pd.DataFrame): A DataFrame containing Statcast data.
+    - by (str or list): Column(s) to group by, as with count_hitter_events.
 
     Returns:
-    - float: The expected batting average (xBA) for the given data.
+    - pd.DataFrame: One row per group with strikeouts ('SO'), walks ('BB'), hit by pitch ('HBP'),
+      sacrifice flies ('SF') and, for each expected stat, the sum of its estimates ('<stat>_sum')
+      and the number of balls in play with one ('<stat>_n').
     '''
-    df = df.copy()
-
-    # Filter balls in play (valid BIP events) where xBA is available
-    balls_in_play = df[(df['events'].isin(BIP_EVENTS)) &  ~df['estimated_ba_using_speedangle'].isnull()]
-    
-    # Sum xBA for balls in play
-    xBA_bip = balls_in_play['estimated_ba_using_speedangle'].sum() 
-    
-    # Count strikeouts (including strikeout_double_play)
-    strikeouts = len(df[df['events'] == 'strikeout']) + len(df[df['events'] == 'strikeout_double_play'])
-
-    # Total plate appearances (BIP + K)
-    total_ab = len(balls_in_play) + strikeouts
+    events = df['events']
+    ball_in_play = events.isin(BIP_EVENTS).to_numpy()
+
+    if by is None:
+        # One value_counts pass covers every plate appearance outcome
+        event_counts = events.value_counts()
+        counts = {stat: sum(event_counts.get(event, 0) for event in outcomes)
+                  for stat, outcomes in EXPECTED_STAT_EVENTS.items()}
+
+        # Sum the estimates over balls in play where they are available
+        for stat, column in EXPECTED_STAT_COLUMNS.items():
+            estimates = df[column].to_numpy(dtype=float)[ball_in_play]
+            has_estimate = ~np.isnan(estimates)
+            counts[f'{stat}_sum'] = estimates[has_estimate].sum()
+            counts[f'{stat}_n'] = has_estimate.sum()
+
+        return pd.DataFrame([counts], dtype=float)
+
+    # Per-pitch indicator columns, summed per group
+    flags = pd.DataFrame({stat: events.isin(outcomes) for stat, outcomes in EXPECTED_STAT_EVENTS.items()},
+                         index=df.index)
+    for stat, column in EXPECTED_STAT_COLUMNS.items():
+        has_estimate = ball_in_play & df[column].notna()
+        flags[f'{stat}_sum'] = df[column].where(has_estimate, 0).astype(float)
+        flags[f'{stat}_n'] = has_estimate
+
+    return flags.groupby([df[key] for key in np.atleast_1d(by)]).sum()
+
+def _safe_divide(numerator, denominator):
+    '''Divide, returning 0 where the denominator is 0. Works on scalars and Series.'''
+    if np.ndim(denominator) == 0:
+        return numerator / denominator if denominator > 0 else 0
+    return (numerator / denominator.where(denominator > 0)).fillna(0)
+
+def expected_stats_from_counts(counts) -> dict:
+    '''
+    Derive xBA, xOBP, xSLG and xwOBA from event counts and estimate sums.
 
-    # Calculate xBA
-    xBA = xBA_bip / total_ab if total_ab > 0 else 0
+    Args:
+    - counts (pd.Series or pd.DataFrame): count_expected_stat_events or count_hitter_events
+      output, or a row of it.
 
-    return xBA
+    Returns:
+    - dict: The expected stats keyed by name.
+    '''
+    so, bb, hbp, sf = counts['SO'], counts['BB'], counts['HBP'], counts['SF']
+
+    # At-bats are balls in play with an estimate plus strikeouts
+    xba_ab = counts['xBA_n'] + so
+    xslg_ab = counts['xSLG_n'] + so
+    xwoba_ab = counts['xwOBA_n'] + so
+
+    return {
+        'xBA': _safe_divide(counts['xBA_sum'], xba_ab),
+        'xOBP': _safe_divide(counts['xBA_sum'] + bb + hbp, xba_ab + bb + hbp + sf),  # fix later, add IBB
+        'xSLG': _safe_divide(counts['xSLG_sum'], xslg_ab),
+        'xwOBA': _safe_divide(W_BB * bb + W_HBP * hbp + counts['xwOBA_sum'], xwoba_ab + bb + sf + hbp)
+    }
 
-def calculate_xOBP(df):  # fix later, add IBB
+def calculate_expected_stats(df: pd.DataFrame) -> dict:
     '''
-    Calculate expected on-base percentage (xOBP) for a given DataFrame of Statcast data.
+    Calculate xBA, xOBP, xSLG and xwOBA for a given DataFrame of Statcast data in one pass.
 
     Args:
     - df (pd.DataFrame): A DataFrame containing Statcast data.
 
     Returns:
-    - float: The expected on-base percentage (xOBP) for the given data.
+    - dict: The expected stats keyed by name.
     '''
-    df = df.copy()
-    
-    # Filter balls in play (valid BIP events) where xBA is available
-    balls_in_play = df[(df['events'].isin(BIP_EVENTS)) & ~df['estimated_ba_using_speedangle'].isnull()]
-    
-    # Sum xHits for balls in play
-    xHits = balls_in_play['estimated_ba_using_speedangle'].sum() 
-    
-    # Count strikeouts (including strikeout_double_play)
-    strikeouts = len(df[df['events'] == 'strikeout']) + len(df[df['events'] == 'strikeout_double_play'])
-
-    # Total at-bats (BIP + K)
-    total_ab = len(balls_in_play) + strikeouts
+    return expected_stats_from_counts(count_expected_stat_events(df).iloc[0])
 
-    # Walks and hit by pitch
-    walks = len(df[df['events'] == 'walk']) ## + intenional_walks
-    hit_by_pitch = len(df[df['events'] == 'hit_by_pitch'])
+def calculate_xBA(df):
+    '''
+    Calculate expected batting average (xBA) for a given DataFrame of Statcast data.
 
-    # Sacrifice flies
-    sac_flies = len(df[df['events'] == 'sac_fly'])
+    Args:
+    - df (pd.DataFrame): A DataFrame containing Statcast data.
 
-    # Numerator: Expected hits + walks + HBP
-    numerator = xHits + walks + hit_by_pitch
+    Returns:
+    - float: The expected batting average (xBA) for the given data.
+    '''
+    return calculate_expected_stats(df)['xBA']
 
-    # Denominator: Total at-bats + walks + HBP + sacrifice flies
-    denominator = total_ab + walks + hit_by_pitch + sac_flies
+def calculate_xOBP(df):  # fix later, add IBB
+    '''
+    Calculate expected on-base percentage (xOBP) for a given DataFrame of Statcast data.
 
-    # Calculate xOBP
-    xOBP = numerator / denominator if denominator > 0 else 0
+    Args:
+    - df (pd.DataFrame): A DataFrame containing Statcast data.
 
-    return xOBP
+    Returns:
+    - float: The expected on-base percentage (xOBP) for the given data.
+    '''
+    return calculate_expected_stats(df)['xOBP']
 
 def calculate_xSLG(df):
     '''
@@ -84,23 +146,7 @@ def calculate_xSLG(df):
     Returns:
     - float: The expected slugging percentage (xSLG) for the given data.
     '''
-    df = df.copy()
-
-    # Filter balls in play (valid BIP events) where xSLG is available
-    balls_in_play = df[(df['events'].isin(BIP_EVENTS)) & ~df['estimated_slg_using_speedangle'].isnull()]
-    
-    # Sum xSLG for balls in play
-    xSLG_bip = balls_in_play['estimated_slg_using_speedangle'].sum()
-    
-    # Count strikeouts (including strikeout_double_play)
-    strikeouts = len(df[df['events'] == 'strikeout']) + len(df[df['events'] == 'strikeout_double_play'])
-
-    # Total plate appearances (BIP + K)
-    total_ab = len(balls_in_play) + strikeouts
-
-    # Calculate xSLG
-    xSLG = xSLG_bip / total_ab if total_ab > 0 else 0
-    return xSLG
+    return calculate_expected_stats(df)['xSLG']
 
 def calculate_xwOBA(df):
     '''
@@ -112,39 +158,7 @@ def calculate_xwOBA(df):
     Returns:
     - float: The expected weighted on-base average (xwOBA) for the given data.
     '''
-    df = df.copy()
-
-    # Define weights for walks and hit-by-pitch
-    w_bb = 0.69  # Weight for walks (BB)
-    w_hbp = 0.72  # Weight for hit by pitch (HBP)
-
-    # Find sacrifice flies (SF) 
-    sf = len(df[df['events'] == 'sac_fly'])
-    
-    # Filter for events with estimated wOBA using speedangle
-    balls_in_play = df[(df['events'].isin(BIP_EVENTS)) & ~df['estimated_woba_using_speedangle'].isnull()]
-    
-    # Calculate the sum of estimated wOBA for valid BIP events
-    xwoba_bip = balls_in_play['estimated_woba_using_speedangle'].sum()
-
-    # Count strikeouts (including strikeout_double_play)
-    strikeouts = len(df[df['events'] == 'strikeout']) + len(df[df['events'] == 'strikeout_double_play'])
-    
-    # Count walks (BB) and hit-by-pitch (HBP)
-    bb = len(df[df['events'] == 'walk'])
-    hbp = len(df[df['events'] == 'hit_by_pitch'])
-    
-    # Sum the contributions from BB and HBP to the numerator
-    xwoba_numerator = (w_bb * bb) + (w_hbp * hbp) + xwoba_bip
-    
-    # Count total plate appearances (PA) (including BB, HBP, strikeouts, and BIP events)
-    total_ab = len(balls_in_play) + strikeouts
-    total_pa = total_ab + bb + sf + hbp
-    
-    # Calculate xwOBA
-    xwOBA = xwoba_numerator / total_pa if total_pa > 0 else 0
-
-    return xwOBA
+    return calculate_expected_stats(df)['xwOBA']
 
 def process_game_logs(df):
     """
@@ -157,8 +171,9 @@ def process_game_logs(df):
         pd.DataFrame: A DataFrame containing the stat totals.
     """
     
-    # Convert all columns to numeric
-    df = df.apply(pd.to_numeric)
+    # Convert to numeric, unless the game logs were already parsed into typed columns
+    if not all(pd.api.types.is_numeric_dtype(df[col]) for col in GAME_LOG_FIELDS):
+        df = df.apply(pd.to_numeric)
     
     # Initialize dictionary to hold stat totals
     stat_totals = {
@@ -192,62 +207,478 @@ def process_game_logs(df):
 
     return stat_totals_df
 
-def process_hitter_data(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_rolling_stats(df: pd.DataFrame, window: int, by: str = 'games') -> pd.DataFrame:
     """
-    Process raw Savant data and calculate advanced stats.
+    Computes rolling AVG, OBP, SLG, OPS, K% and BB% over a player's game logs.
+
+    Every game closes one window: the last `window` games (by='games'), or the fewest
+    most recent games that add up to at least `window` plate appearances (by='PA').
+    Early-season windows that are not full yet cover every game so far. Window totals
+    are differences of cumulative sums, so the whole season costs O(n) per window size.
+
+    Args:
+        df (pd.DataFrame): Game logs in date order, e.g. from get_filtered_game_logs.
+        window (int): Window length in games or plate appearances.
+        by (str): 'games' or 'PA'.
+
+    Returns:
+        pd.DataFrame: One row per game with the Date, the window's G and PA, and its rates.
+    """
+    if by not in ('games', 'PA'):
+        raise ValueError(f"by must be 'games' or 'PA', not {by!r}")
+
+    stats = ['G', 'PA', 'AB', 'H', '2B', '3B', 'HR', 'BB', 'HBP', 'SO']
+    counts = df[stats].apply(pd.to_numeric).to_numpy(dtype=np.int64)
+
+    # Row k of the cumulative sums holds the totals of the first k games
+    cumulative = np.vstack([np.zeros((1, len(stats)), dtype=np.int64), counts.cumsum(axis=0)])
+    end = np.arange(1, len(counts) + 1)
+
+    if by == 'games':
+        start = np.maximum(end - window, 0)
+    else:
+        # Latest start that still leaves at least `window` PA in the window
+        pa = cumulative[:, stats.index('PA')]
+        start = np.maximum(np.searchsorted(pa, pa[end] - window, side='right') - 1, 0)
+
+    totals = pd.DataFrame(cumulative[end] - cumulative[start], columns=stats, index=df.index)
+
+    singles = totals['H'] - totals['2B'] - totals['3B'] - totals['HR']
+    total_bases = singles + 2 * totals['2B'] + 3 * totals['3B'] + 4 * totals['HR']
+
+    rolling = pd.DataFrame({'Date': df['Date'], 'G': totals['G'], 'PA': totals['PA']})
+    rolling['AVG'] = _safe_divide(totals['H'], totals['AB'])
+    rolling['OBP'] = _safe_divide(totals['H'] + totals['BB'] + totals['HBP'], totals['PA'])
+    rolling['SLG'] = _safe_divide(total_bases, totals['AB'])
+    rolling['OPS'] = rolling['OBP'] + rolling['SLG']
+    rolling['K%'] = _safe_divide(totals['SO'], totals['PA']) * 100
+    rolling['BB%'] = _safe_divide(totals['BB'], totals['PA']) * 100
+
+    return rolling
+
+def count_hitter_events(df: pd.DataFrame, by=None) -> pd.DataFrame:
+    """
+    Count every event behind the hitter metrics in one vectorized pass.
 
     Args:
     - df (pd.DataFrame): A DataFrame containing raw Savant data.
+    - by (str or list): Column(s) to group by, e.g. 'batter'. If None, the whole
+      frame is counted as a single row.
 
     Returns:
-    - pd.DataFrame: A DataFrame containing cleaned stats for the hitter.
+    - pd.DataFrame: One row per group with the counts (PA, BIP, swings, whiffs, zone and
+      chase pitches/swings, hard hits, barrels, sweet spots) plus the count_expected_stat_events
+      columns used by expected_stats_from_counts.
     """
+    events = df['events']
+    ball_in_play = events.isin(BIP_EVENTS)
+    swing = df['description'].isin(SWING_CODE)
+    in_zone = df['zone'] < 10
+    out_zone = df['zone'] > 10
+
+    # Per-pitch indicator columns, summed per group below
+    flags = pd.DataFrame({
+        'PA': events.notna(),
+        'BIP': ball_in_play,
+        'swings': swing,
+        'whiffs': df['description'].isin(WHIFF_CODE),
+        'zone_pitches': in_zone,
+        'zone_swings': in_zone & swing,
+        'chase_pitches': out_zone,
+        'chases': out_zone & swing,
+        'hard_hit': ball_in_play & (df['launch_speed'] >= 95),
+        'barrels': ball_in_play & classify_barrels(df['launch_speed'], df['launch_angle']),
+        'sweet_spots': ball_in_play & classify_sweet_spots(df['launch_angle'])
+    }, index=df.index)
+
+    if by is None:
+        counts = flags.sum().to_frame().T
+    else:
+        counts = flags.groupby([df[key] for key in np.atleast_1d(by)]).sum()
+
+    # Expected stat events and estimates, from the one definition the expected stats use
+    return pd.concat([counts, count_expected_stat_events(df, by=by)], axis=1)
+
+def hitter_metrics_from_counts(counts: pd.DataFrame, ev90) -> pd.DataFrame:
+    """
+    Derive the card's advanced metrics from count_hitter_events output.
+
+    Args:
+    - counts (pd.DataFrame): Output of count_hitter_events.
+    - ev90 (float or pd.Series): 90th percentile exit velocity per row of counts.
 
-    # Add derived columns
-    df['ball_in_play'] = df['events'].isin(BIP_EVENTS)
-    df['swing'] = df['description'].isin(SWING_CODE)
-    df['whiff'] = df['description'].isin(WHIFF_CODE)
-    df['in_zone'] = df['zone'] < 10
-    df['out_zone'] = df['zone'] > 10
-    df['chase'] = df['out_zone'] & df['swing']
-    df['hard_hit'] = (df['launch_speed'] >= 95) & (df['ball_in_play'])
-    df['ev90'] = df.loc[df['events'].isin(BIP_EVENTS), 'launch_speed'].quantile(0.9)
-    df['max_ev'] = df.loc[df['events'].isin(BIP_EVENTS), 'launch_speed'].max()
-    df['barrel'] = df.apply(lambda x: is_barrel(x['launch_speed'], x['launch_angle']), axis=1)
-    df['sweet_spot'] = df['launch_angle'].apply(is_sweet_spot) & df['ball_in_play']
-
-    # Calculate advanced stats
-    zone_swing_rate = df[df['in_zone']]['swing'].mean()
-    out_of_zone_swing_rate = df[df['out_zone']]['swing'].mean()
-    whiff_rate = df['whiff'].sum() / df['swing'].sum()
-    hard_hit_rate = df['hard_hit'].sum() / df['ball_in_play'].sum()
-    barrel_rate = df[df['ball_in_play']]['barrel'].mean()
-    sweet_spot_rate = df[df['ball_in_play']]['sweet_spot'].mean()
+    Returns:
+    - pd.DataFrame: One row of metrics per row of counts. Rates with no
+      qualifying pitches are NaN.
+    """
+    # Rates (NaN when there are no qualifying pitches)
+    zone_swing_rate = counts['zone_swings'] / counts['zone_pitches'].where(counts['zone_pitches'] > 0)
+    out_of_zone_swing_rate = counts['chases'] / counts['chase_pitches'].where(counts['chase_pitches'] > 0)
+    whiff_rate = counts['whiffs'] / counts['swings'].where(counts['swings'] > 0)
+    bip = counts['BIP'].where(counts['BIP'] > 0)
+    hard_hit_rate = counts['hard_hit'] / bip
+    barrel_rate = counts['barrels'] / bip
+    sweet_spot_rate = counts['sweet_spots'] / bip
 
     # Advanced metrics
-    xBA = calculate_xBA(df)
-    xSLG = calculate_xSLG(df)
-    xwOBA = calculate_xwOBA(df)
+    expected_stats = expected_stats_from_counts(counts)
 
     # Assemble stats
-    stats = {
+    return pd.DataFrame({
         "Z-O Swing%": 100 * (zone_swing_rate - out_of_zone_swing_rate),
         "O-Swing%": out_of_zone_swing_rate * 100,
         "Z-Swing%": zone_swing_rate * 100,
-        "Z-O Swing%": 100 * (zone_swing_rate - out_of_zone_swing_rate),
         "Whiff%": whiff_rate * 100,
-        #"Max EV": df['max_ev'].values[0],
+        #"Max EV": max_ev,
         "Sweet Spot%": sweet_spot_rate * 100,
         "Hard Hit%": hard_hit_rate * 100,
         "Barrel%": barrel_rate * 100,
-        "EV90": df['ev90'].values[0],
-        "xSLG": xSLG,
-        "xBA": xBA,
-        "xwOBA": xwOBA,
-    }
+        "EV90": ev90,
+        "xSLG": expected_stats['xSLG'],
+        "xBA": expected_stats['xBA'],
+        "xwOBA": expected_stats['xwOBA'],
+    }, index=counts.index)
+
+def process_hitter_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Process raw Savant data and calculate advanced stats.
+
+    Args:
+    - df (pd.DataFrame): A DataFrame containing raw Savant data.
+
+    Returns:
+    - pd.DataFrame: A DataFrame containing cleaned stats for the hitter.
+    """
+    counts = count_hitter_events(df)
+    ev90 = df.loc[df['events'].isin(BIP_EVENTS), 'launch_speed'].quantile(0.9)
+
+    return hitter_metrics_from_counts(counts, ev90).reset_index(drop=True)
+
+def process_league_hitter_data(df: pd.DataFrame, min_pa: int = 0) -> pd.DataFrame:
+    """
+    Calculate the process_hitter_data metrics for every batter in one grouped pass.
+
+    Args:
+    - df (pd.DataFrame): Raw Savant data for all batters (e.g. a full-season pyb.statcast pull).
+    - min_pa (int): Minimum plate appearances for a batter to be included.
+
+    Returns:
+    - pd.DataFrame: One row per batter with player_id, PA, batted_ball and the
+      process_hitter_data metrics, in the layout of the data/clean{season}.csv tables.
+    """
+    counts = count_hitter_events(df, by='batter')
+    ev90 = (df['launch_speed'].where(df['events'].isin(BIP_EVENTS))
+            .groupby(df['batter']).quantile(0.9))
+
+    metrics = hitter_metrics_from_counts(counts, ev90)
+    metrics.insert(0, 'batted_ball', counts['BIP'])
+    metrics.insert(0, 'PA', counts['PA'])
+    metrics = metrics[metrics['PA'] >= min_pa]
+
+    return metrics.rename_axis('player_id').reset_index()
+
+def build_ev_sketch(speeds) -> tuple:
+    """
+    Summarize exit velocities as a sparse histogram with EV_SKETCH_RESOLUTION wide bins.
+
+    Sketches merge by adding counts, so a date range's sketch is the merge of its games'.
+    Speeds are rounded to the nearest bin, so every value a sketch returns is within
+    EV_SKETCH_RESOLUTION / 2 of the exact answer. Statcast speeds are already on the
+    0.1 mph grid, so at the default resolution there is no error at all.
+
+    Args:
+    - speeds (array-like): Launch speeds (mph). NaNs are ignored.
+
+    Returns:
+    - tuple: (bins, counts), the sorted occupied bin numbers and their counts.
+    """
+    speeds = np.asarray(speeds, dtype=float)
+    bins = np.rint(speeds[~np.isnan(speeds)] / EV_SKETCH_RESOLUTION).astype(np.int32)
+    return tuple(np.unique(bins, return_counts=True))
+
+def merge_ev_sketches(sketches) -> tuple:
+    """
+    Merge exit velocity sketches (or the concatenated bins and counts of many sketches).
+
+    Args:
+    - sketches (list): (bins, counts) tuples from build_ev_sketch.
+
+    Returns:
+    - tuple: The merged (bins, counts).
+    """
+    sketches = list(sketches)
+    if not sketches:
+        return np.array([], dtype=np.int32), np.array([], dtype=np.int64)
+    bins = np.concatenate([bins for bins, _ in sketches])
+    counts = np.concatenate([counts for _, counts in sketches])
+    merged_bins, inverse = np.unique(bins, return_inverse=True)
+    return merged_bins, np.bincount(inverse, weights=counts, minlength=len(merged_bins)).astype(np.int64)
+
+def ev_sketch_quantile(sketch: tuple, q: float) -> float:
+    """
+    Quantile of a sketched set of exit velocities, interpolated like Series.quantile.
+
+    Args:
+    - sketch (tuple): (bins, counts) from build_ev_sketch or merge_ev_sketches.
+    - q (float): Quantile, between 0 and 1.
+
+    Returns:
+    - float: The quantile, or NaN for an empty sketch.
+    """
+    bins, counts = sketch
+    n = counts.sum()
+    if n == 0:
+        return np.nan
+
+    # Linear interpolation between the order statistics around rank q * (n - 1)
+    rank = q * (n - 1)
+    ends = np.cumsum(counts)
+    lower = bins[np.searchsorted(ends, np.floor(rank), side='right')]
+    upper = bins[np.searchsorted(ends, np.ceil(rank), side='right')]
+    return (lower + (upper - lower) * (rank - np.floor(rank))) * EV_SKETCH_RESOLUTION
+
+def ev_sketch_max(sketch: tuple) -> float:
+    """Highest exit velocity in a sketch, or NaN for an empty sketch."""
+    bins, _ = sketch
+    return bins[-1] * EV_SKETCH_RESOLUTION if len(bins) else np.nan
+
+def build_game_ev_sketches(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the exit velocity sketch of every batter's games.
+
+    Args:
+    - df (pd.DataFrame): Raw Savant data.
+
+    Returns:
+    - pd.DataFrame: A 'count' column indexed by (batter, game_date, ev_bin), sorted. The rows
+      of one game are its sketch's bins and counts.
+    """
+    bip = df[df['events'].isin(BIP_EVENTS) & df['launch_speed'].notna()]
+    ev_bin = np.rint(bip['launch_speed'].to_numpy(dtype=float) / EV_SKETCH_RESOLUTION).astype(np.int32)
+    return (bip.groupby([bip['batter'], bip['game_date'], pd.Series(ev_bin, index=bip.index, name='ev_bin')],
+                        observed=True)
+            .size().rename('count').to_frame().sort_index())
+
+def build_game_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count the hitter metric events of every batter's games.
+
+    Args:
+    - df (pd.DataFrame): Raw Savant data.
+
+    Returns:
+    - pd.DataFrame: count_hitter_events output per (batter, game_date), sorted by both.
+    """
+    return count_hitter_events(df, by=['batter', 'game_date']).sort_index()
+
+# Per-game event counts of cached player seasons, keyed by (player_id, season):
+# (pitch cache mtime, game dates, prefix sums of the counts, game exit velocity sketches)
+_game_aggregates = {}
+
+def _get_game_aggregates(player_id: int, season: int) -> tuple:
+    """
+    Get a player's per-game data for a season from the pitch cache: the game dates, the
+    prefix sums of their counts (row k is the total of the first k games), and their exit
+    velocity sketches as (bins, counts, offsets) where game k's bins are bins[offsets[k]:offsets[k + 1]].
+    Rebuilt only when the cache file changes; None if the season isn't cached.
+    """
+    path = get_pitch_cache_path(player_id, season)
+    if not os.path.exists(path):
+        return None
+    mtime = os.stat(path).st_mtime_ns
+
+    key = (int(player_id), int(season))
+    cached = _game_aggregates.get(key)
+    if cached is None or cached[0] != mtime:
+        pitches = pd.read_parquet(path)
+        aggregates = build_game_aggregates(pitches).droplevel('batter')
+        prefix = pd.DataFrame(np.vstack([np.zeros((1, aggregates.shape[1])),
+                                         aggregates.to_numpy(dtype=float).cumsum(axis=0)]),
+                              columns=aggregates.columns)
+
+        # Lay the game sketches end to end, in the same game order as the counts
+        sketches = build_game_ev_sketches(pitches).droplevel('batter')
+        dates = aggregates.index.to_numpy(dtype=str)
+        sketch_dates = sketches.index.get_level_values('game_date').to_numpy(dtype=str)
+        offsets = np.searchsorted(sketch_dates, np.append(dates, '9999-12-31'), side='left')
+        sketch = (sketches.index.get_level_values('ev_bin').to_numpy(dtype=np.int32),
+                  sketches['count'].to_numpy(dtype=np.int64), offsets)
+
+        _game_aggregates[key] = (mtime, dates, prefix, sketch)
+
+    return _game_aggregates[key][1:]
+
+def process_cached_hitter_data(player_id: int, start_dt: str, end_dt: str) -> pd.DataFrame:
+    """
+    Calculate the process_hitter_data metrics for a date range from the pitch cache.
+
+    The counts come from per-game aggregates built once per cached season, so a range
+    costs two prefix-sum lookups instead of a scan of every pitch. EV90 comes from the
+    merged exit velocity sketches of the range's games (see build_ev_sketch for its
+    error bound). Dates the pitch cache is missing (or holds stale) are downloaded first.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - start_dt (str): The start date in "YYYY-MM-DD" format.
+    - end_dt (str): The end date in "YYYY-MM-DD" format.
+
+    Returns:
+    - pd.DataFrame: One row of metrics, as process_hitter_data returns.
+    """
+    counts, sketch = _cached_range_data(player_id, start_dt, end_dt)
+    ev90 = ev_sketch_quantile(sketch, 0.9)
+    return hitter_metrics_from_counts(counts.to_frame().T, ev90).reset_index(drop=True)
+
+def get_cached_exit_velocity(player_id: int, start_dt: str, end_dt: str) -> dict:
+    """
+    Get EV90 and max exit velocity for a date range from the pitch cache's game sketches,
+    downloading any dates the cache is missing first.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - start_dt (str): The start date in "YYYY-MM-DD" format.
+    - end_dt (str): The end date in "YYYY-MM-DD" format.
+
+    Returns:
+    - dict: EV90 and Max EV (mph), NaN if there are no batted balls.
+    """
+    _, sketch = _cached_range_data(player_id, start_dt, end_dt)
+    return {'EV90': ev_sketch_quantile(sketch, 0.9), 'Max EV': ev_sketch_max(sketch)}
+
+def _cached_range_data(player_id: int, start_dt: str, end_dt: str) -> tuple:
+    """Total the cached per-game counts and merge the exit velocity sketches of a date range."""
+    # Fill in missing or stale dates so the totals are never silently partial
+    update_savant_cache(player_id, start_dt, end_dt)
+
+    counts = None
+    sketches = []
+    for season in range(int(start_dt[:4]), int(end_dt[:4]) + 1):
+        aggregates = _get_game_aggregates(player_id, season)
+        if aggregates is None:
+            continue
+        dates, prefix, (bins, bin_counts, offsets) = aggregates
+        first, last = np.searchsorted(dates, start_dt, side='left'), np.searchsorted(dates, end_dt, side='right')
+
+        season_counts = prefix.iloc[last] - prefix.iloc[first]
+        counts = season_counts if counts is None else counts + season_counts
+        sketches.append((bins[offsets[first]:offsets[last]], bin_counts[offsets[first]:offsets[last]]))
+
+    if counts is None:
+        counts = count_hitter_events(pd.DataFrame(columns=['events', 'description', 'zone', 'launch_speed',
+                                                           'launch_angle', *EXPECTED_STAT_COLUMNS.values()])).iloc[0]
+
+    return counts, merge_ev_sketches(sketches)
+
+# Parsed league tables, keyed by season: (file mtime, DataFrame)
+_league_tables = {}
+
+def load_league_stats(season: int) -> pd.DataFrame:
+    """
+    Load a season's league reference table (data/clean{season}.csv).
+
+    The CSV is parsed once per process and kept in memory; it is only re-parsed
+    when the file's modification time changes.
+
+    Args:
+    - season (int): The season year.
+
+    Returns:
+    - pd.DataFrame: The league table. Treat it as read-only, it is shared between callers.
+    """
+    path = f'data/clean{season}.csv'
+    mtime = os.stat(path).st_mtime_ns
+
+    cached = _league_tables.get(season)
+    if cached is None or cached[0] != mtime:
+        league_stats = pd.read_csv(path)
+
+        # Narrow the integer columns; floats stay float64 so percentile ties match the CSV values
+        for column in league_stats.select_dtypes('integer').columns:
+            league_stats[column] = pd.to_numeric(league_stats[column], downcast='integer')
+
+        _league_tables[season] = (mtime, league_stats)
+
+    return _league_tables[season][1]
+
+# Sorted league values per metric, keyed by season: (league table, index)
+_percentile_indexes = {}
+
+def get_percentile_index(season: int) -> dict:
+    """
+    Get the percentile index for a season: each league metric's values, sorted.
+
+    The index is built on first use and rebuilt whenever load_league_stats reloads the table.
+
+    Args:
+    - season (int): The season year.
+
+    Returns:
+    - dict: Metric name -> sorted np.ndarray of league values (NaNs dropped).
+    """
+    league_stats = load_league_stats(season)
+
+    cached = _percentile_indexes.get(season)
+    if cached is None or cached[0] is not league_stats:
+        index = {
+            metric: np.sort(league_stats[metric].dropna().to_numpy(dtype=float))
+            for metric in league_stats.select_dtypes('number').columns
+        }
+        _percentile_indexes[season] = (league_stats, index)
+
+    return _percentile_indexes[season][1]
+
+def percentile_of(sorted_values: np.ndarray, values) -> np.ndarray:
+    """
+    Vectorized percentileofscore(kind='mean') using binary search.
+
+    Args:
+    - sorted_values (np.ndarray): League values, sorted ascending.
+    - values (array-like): Scores to rank.
+
+    Returns:
+    - np.ndarray: Percentile of each score (NaN for NaN scores or an empty league).
+    """
+    values = np.asarray(values, dtype=float)
+    if len(sorted_values) == 0:
+        return np.full(values.shape, np.nan)
+
+    # Average of the strict (<) and weak (<=) ranks, as with kind='mean'
+    below = np.searchsorted(sorted_values, values, side='left')
+    at_or_below = np.searchsorted(sorted_values, values, side='right')
+    percentiles = (below + at_or_below) * 50.0 / len(sorted_values)
+
+    return np.where(np.isnan(values), np.nan, percentiles)
+
+def calculate_percentiles(player_stats: pd.DataFrame, season: int) -> pd.DataFrame:
+    """
+    Calculate card percentiles for one or many players against the season's league table.
+
+    Percentiles are floored at 1 and flipped for LOWER_IS_BETTER metrics. Missing
+    metrics are floored to 1 as well, before the flip.
+
+    Args:
+    - player_stats (pd.DataFrame): One row per player with process_hitter_data metrics.
+    - season (int): The season year.
+
+    Returns:
+    - pd.DataFrame: Percentiles for every metric found in the league table, same index as player_stats.
+    """
+    index = get_percentile_index(season)
+
+    percentiles = {}
+    for metric in player_stats.columns:
+        if metric not in index:
+            continue  # Skip metrics not in league stats
+
+        # Ensure at least 1st percentile, also after adjusting "lower is better" metrics.
+        # fmax floors a missing metric (e.g. EV90 with no balls in play) to 1 rather than NaN
+        adjusted = np.fmax(1, percentile_of(index[metric], player_stats[metric]))
+        if metric in LOWER_IS_BETTER:
+            adjusted = np.maximum(1, 100 - adjusted)
+        percentiles[metric] = adjusted
+
+    return pd.DataFrame(percentiles, index=player_stats.index)
 
-    return pd.DataFrame([stats])
-    
 def is_sweet_spot(launch_angle) -> bool:
     '''
     Determine if a given launch angle is in the "sweet spot" range.
@@ -271,50 +702,45 @@ def is_barrel(launch_speed, launch_angle) -> bool:
     Returns:
     - bool: True if the batted ball is a "barrel", False otherwise.
     '''
-    if launch_speed < 97.5:
-        return False  # Below the minimum speed
-    
-    # Define bounds for specific launch speeds
-    if 97.5 <= launch_speed < 98.5:
-        lower_bound, upper_bound = 26, 30
-    elif 98.5 <= launch_speed < 99.5:
-        lower_bound, upper_bound = 25, 31
-    elif 99.5 <= launch_speed < 100.5:
-        lower_bound, upper_bound = 24, 33
-    elif 100.5 <= launch_speed < 101.5:
-        lower_bound, upper_bound = 23, 35
-    elif 101.5 <= launch_speed < 102.5:
-        lower_bound, upper_bound = 22, 36
-    elif 102.5 <= launch_speed < 103.5:
-        lower_bound, upper_bound = 21, 37
-    elif 103.5 <= launch_speed < 104.5:
-        lower_bound, upper_bound = 20, 38
-    elif 104.5 <= launch_speed < 105.5:
-        lower_bound, upper_bound = 19, 39
-    elif 105.5 <= launch_speed < 106.5:
-        lower_bound, upper_bound = 18, 40
-    elif 106.5 <= launch_speed < 107.5:
-        lower_bound, upper_bound = 17, 41
-    elif 107.5 <= launch_speed < 108.5:
-        lower_bound, upper_bound = 16, 42
-    elif 108.5 <= launch_speed < 109.5:
-        lower_bound, upper_bound = 15, 43
-    elif 109.5 <= launch_speed < 110.5:
-        lower_bound, upper_bound = 14, 44
-    elif 110.5 <= launch_speed < 111.5:
-        lower_bound, upper_bound = 13, 45
-    elif 111.5 <= launch_speed < 112.5:
-        lower_bound, upper_bound = 12, 46
-    elif 112.5 <= launch_speed < 113.5:
-        lower_bound, upper_bound = 11, 47
-    elif 113.5 <= launch_speed < 114.5:
-        lower_bound, upper_bound = 10, 48
-    elif 114.5 <= launch_speed < 115.5:
-        lower_bound, upper_bound = 9, 49
-    elif launch_speed >= 115.5:
-        lower_bound, upper_bound = 8, 50
-    else:
-        return False  # Catch unexpected cases
-    
-    # Ensure strict bounds
-    return lower_bound <= launch_angle <= upper_bound
\ No newline at end of file
+    return bool(classify_barrels([launch_speed], [launch_angle])[0])
+
+def classify_sweet_spots(launch_angle) -> np.ndarray:
+    '''
+    Vectorized is_sweet_spot: flag every launch angle in the "sweet spot" range at once.
+
+    Args:
+    - launch_angle (array-like): Launch angles of the batted balls.
+
+    Returns:
+    - np.ndarray: Boolean array, True where the launch angle is in the sweet spot (NaN is False).
+    '''
+    angle = np.asarray(launch_angle, dtype=float)
+    lower, upper = SWEET_SPOT_ANGLES
+    return (angle >= lower) & (angle < upper)
+
+def classify_barrels(launch_speed, launch_angle) -> np.ndarray:
+    '''
+    Vectorized is_barrel: classify every batted ball in one pass.
+
+    Each launch speed is mapped to its 1 mph band and the band's launch angle
+    bounds are looked up from BARREL_LOWER_ANGLES / BARREL_UPPER_ANGLES.
+
+    Args:
+    - launch_speed (array-like): Launch speeds of the batted balls.
+    - launch_angle (array-like): Launch angles of the batted balls.
+
+    Returns:
+    - np.ndarray: Boolean array, True where the batted ball is a "barrel" (NaN is False).
+    '''
+    speed = np.asarray(launch_speed, dtype=float)
+    angle = np.asarray(launch_angle, dtype=float)
+    lower_angles = np.asarray(BARREL_LOWER_ANGLES)
+    upper_angles = np.asarray(BARREL_UPPER_ANGLES)
+
+    # Band index per ball; speeds below the minimum (or NaN) are masked out below
+    band = np.floor(np.nan_to_num(speed - BARREL_MIN_SPEED, nan=0.0))
+    band = np.clip(band, 0, len(lower_angles) - 1).astype(int)
+
+    return ((speed >= BARREL_MIN_SPEED)
+            & (angle >= lower_angles[band])
+            & (angle <= upper_angles[band]))
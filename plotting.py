@@ -3,68 +3,214 @@ from data_processing import *
 import matplotlib.pyplot as plt
 from PIL import Image
 from io import BytesIO
-from scipy.stats import percentileofscore
 import numpy as np
-import matplotlib.patches as patches
 import matplotlib.gridspec as gridspec
+from matplotlib.collections import PolyCollection, EllipseCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 
-def plot_headshot(player_id: int, ax: plt.Axes):
+# Stats shown in the standard stats table
+STD_STATS = ['PA', 'R', 'HR', 'RBI', 'SB', 'AVG', 'OBP', 'SLG', 'OPS', 'K%', 'BB%']
+
+# Percentile chart metrics, bottom to top (the order process_hitter_data returns them in)
+PERCENTILE_METRICS = ['Z-O Swing%', 'O-Swing%', 'Z-Swing%', 'Whiff%', 'Sweet Spot%', 'Hard Hit%',
+                      'Barrel%', 'EV90', 'xSLG', 'xBA', 'xwOBA']
+
+# Baseball Savant percentile colormap for heatmaps and leaderboards, e.g.
+# ax.imshow(pcts, cmap=SAVANT_CMAP, vmin=0, vmax=100)
+SAVANT_CMAP = ListedColormap(SAVANT_COLOR_LUT, name='savant')
+
+def _draw_image(ax: plt.Axes):
+    """Create an empty image artist filling the axes, to be filled with set_data."""
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    image = ax.imshow(np.zeros((1, 1, 4)), extent=[0, 1, 0, 1], origin='upper')
+    ax.axis('off')
+    return image
+
+def _draw_bio_text(ax: plt.Axes) -> list:
+    """Create the three (empty) bio text lines: name, team and details."""
+    texts = [
+        ax.text(0.5, 0.65, '', va='bottom', ha='center', fontsize=55, fontweight='bold'),
+        ax.text(0.5, 0.325, '', va='bottom', ha='center', fontsize=35),
+        ax.text(0.5, 0, '', va='bottom', ha='center', fontsize=35)
+    ]
+    ax.axis('off')
+    return texts
+
+def _update_bio_text(texts: list, player_data: dict):
+    """Fill the bio text lines with a player's bio data."""
+    texts[0].set_text(f'{player_data["primary_position"]} {player_data["player_name"]}')
+    texts[1].set_text(f'{player_data["team"]}')
+    texts[2].set_text(f'B/T: {player_data["batting_hand"]}/{player_data["throwing_hand"]} | {player_data["height"]}/{player_data["weight"]} | Age: {player_data["age"]}')
+
+def _draw_std_stats_table(ax: plt.Axes, columns: list):
+    """Create the standard stats table with a header row and one empty row."""
+    table = ax.table(cellText=[[''] * len(columns)], colLabels=columns, cellLoc='center', bbox=[0.0, 0.0, 1.0, 1.0])
+    
+    # Set font size
+    table.set_fontsize(25)
+    table.auto_set_font_size(False)
+    
+    # Make column headers bold
+    for i, cell in table.get_celld().items():
+        if i[0] == 0:
+            cell.set_text_props(weight='bold')
+    
+    # Hide the axes
+    ax.axis('off')
+
+    return table
+
+def _update_std_stats_table(table, df: pd.DataFrame):
+    """Fill the standard stats table's value row from a one-row DataFrame."""
+    for j, value in enumerate(df.iloc[0]):
+        table[1, j].get_text().set_text(str(value))
+
+def _format_metric_value(metric: str, value: float) -> str:
+    """Format a percentile chart value the way Baseball Savant does."""
+    return (f'{value:.3f}'[1:] if metric in ['xBA', 'xSLG', 'xwOBA'] and value < 1
+            else f'{value:.3f}' if metric in ['xBA', 'xSLG', 'xwOBA']
+            else f'{value:.1f}' if metric == 'EV90'
+            else f'{value:.1f}%')
+
+def _bar_verts(widths, bar_height: float) -> np.ndarray:
+    """Corner vertices of horizontal bars starting at x=0, one bar per row (y = 0, 1, 2, ...)."""
+    widths = np.asarray(widths, dtype=float)
+    y = np.arange(len(widths))
+    x0, y0, y1 = np.zeros_like(widths), y - bar_height / 2, y + bar_height / 2
+    return np.stack([np.column_stack([x0, y0]), np.column_stack([x0, y1]),
+                     np.column_stack([widths, y1]), np.column_stack([widths, y0])], axis=1)
+
+def _draw_percentile_chart(ax: plt.Axes, metrics: list) -> dict:
+    """
+    Create the percentile chart's bars, circles and labels (one row per metric) and style the axes.
+
+    The bars and circles of every metric are drawn as three collections rather than one patch each.
+
+    Returns:
+    - dict: The artists that change from player to player.
+    """
+    bar_height = 0.85
+    n = len(metrics)
+    
+    # Background gray bars
+    ax.add_collection(PolyCollection(_bar_verts(np.full(n, 100), bar_height / 4),
+                                     facecolors=PERCENTILE_COLORS['gray'], edgecolors='none', zorder=1))
+    
+    # Colored percentile bars
+    bars = PolyCollection(_bar_verts(np.zeros(n), bar_height), edgecolors='none', zorder=2)
+    ax.add_collection(bars)
+    
+    # Circles
+    circles = EllipseCollection(widths=bar_height * 6.8,  # not sure why this works
+                                heights=bar_height, angles=0, units='xy',
+                                offsets=np.column_stack([np.zeros(n), np.arange(n)]),
+                                offset_transform=ax.transData,
+                                edgecolors='white', linewidths=3, zorder=3)
+    ax.add_collection(circles)
+    
+    pct_texts, value_texts = [], []
+    for i in range(n):
+        # Percentile text
+        pct_texts.append(ax.text(0, i, '', 
+                ha='center', va='center_baseline',
+                color='white', 
+                fontweight='bold',
+                zorder=4))
+        
+        # Value text
+        value_texts.append(ax.text(103, i, '',
+                ha='left', va='center',
+                fontsize=25))
+    
+    # Styling
+    ax.set_yticks(np.arange(n))
+    ax.set_yticklabels(metrics, fontsize=25, ha='right')
+    ax.set_xlim(-10, 110)
+    for label in ax.get_yticklabels():
+        label.set_x(.07)  # Adjust the value as needed
+    ax.set_xlabel("")
+    ax.grid(False)
+    ax.set_xticks([])  # Remove x-axis numbers
+    ax.spines['left'].set_visible(False)   # Remove left spine
+    ax.spines['right'].set_visible(False)  # Remove right spine
+    ax.spines['top'].set_visible(False)    # Remove top spine
+    ax.spines['bottom'].set_visible(False) # Remove bottom spine
+
+    return {'bars': bars, 'circles': circles, 'bar_height': bar_height,
+            'pct_texts': pct_texts, 'value_texts': value_texts}
+
+def _update_percentile_chart(chart: dict, metrics: list, player_stats: dict, percentiles: dict):
+    """Move the percentile chart's bars, circles and labels to a player's values."""
+    pcts = np.array([percentiles[metric] for metric in metrics], dtype=float)
+    colors = get_savant_colors(pcts)
+
+    chart['bars'].set_verts(_bar_verts(pcts, chart['bar_height']))
+    chart['bars'].set_facecolor(colors)
+    chart['circles'].set_offsets(np.column_stack([pcts, np.arange(len(pcts))]))
+    chart['circles'].set_facecolor(colors)
+
+    for metric, pct, pct_text, value_text in zip(metrics, pcts, chart['pct_texts'], chart['value_texts']):
+        # Adjust font size if percentile is 100
+        pct_text.set_x(pct)
+        pct_text.set_text(f'{int(pct)}')
+        pct_text.set_fontsize(22 if pct == 100 else 27)
+
+        value_text.set_text(_format_metric_value(metric, player_stats[metric]))
+
+def plot_headshot(player_id: int, ax: plt.Axes, img: Image = None):
     """
     Fetches and plots the player's headshot image on the given axes.
 
     Args:
     - player_id (int): The unique player ID.
     - ax (plt.Axes): The Matplotlib axes on which to plot the image.
+    - img (Image): Prefetched headshot image. Fetched if not provided.
     """
     # Get the headshot image using the player ID
-    img = get_headshot(player_id)
+    if img is None:
+        img = get_headshot(player_id)
     
     # Plot the image on the provided axes
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.imshow(img, extent=[0, 1, 0, 1], origin='upper')
-    ax.axis('off')
+    _draw_image(ax).set_data(img)
 
     # Note: plot_headshot(player_id, plt.gca()) is good for quick plots
 
-def plot_player_bio(player_id: str, ax: plt.Axes):
+def plot_player_bio(player_id: str, ax: plt.Axes, context: dict = None):
     """
     Fetches player bio data and plots it on the given axes.
     
     Args:
     - player_id (str): The unique player ID.
     - ax (plt.Axes): The Matplotlib axes on which to plot the bio information.
+    - context (dict): Player context from get_player_context. Fetched if not provided.
     """
     # Get player bio data
-    player_data = get_player_bio(player_id)
+    player_data = get_player_bio(player_id, context)
 
     # Plot player bio data
-    ax.text(0.5, 0.65, f'{player_data["primary_position"]} {player_data["player_name"]}',
-            va='bottom', ha='center', fontsize=55, fontweight='bold')
-    ax.text(0.5, 0.325, f'{player_data["team"]}', va='bottom', ha='center', fontsize=35)
-    ax.text(0.5, 0, f'B/T: {player_data["batting_hand"]}/{player_data["throwing_hand"]} | {player_data["height"]}/{player_data["weight"]} | Age: {player_data["age"]}',
-            va='bottom', ha='center', fontsize=35)
-    
-    ax.axis('off')
+    _update_bio_text(_draw_bio_text(ax), player_data)
 
-def plot_team_logo(player_id: str, ax: plt.Axes):
+def plot_team_logo(player_id: str, ax: plt.Axes, context: dict = None, img: Image = None):
     """
     Fetches and displays the logo of a player's current MLB team on a given Matplotlib axis.
 
     Args:
         player_id (str): The player's MLB ID.
         ax (plt.Axes): Matplotlib axis to display the logo on.
+        context (dict): Player context from get_player_context. Fetched if not provided.
+        img (Image): Prefetched team logo. Fetched if not provided.
     """
     # Get the team logo
-    img = get_team_logo(player_id)
+    if img is None:
+        img = get_team_logo(player_id, context)
     
     if img:
         # Plot the team logo if it was successfully fetched
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        ax.imshow(img, extent=[0, 1, 0, 1], origin='upper')
-        ax.axis('off')  # Disable the axis for a clean look
+        _draw_image(ax).set_data(img)
     else:
         print("Failed to fetch team logo.")
 
@@ -90,7 +236,7 @@ def plot_timeframe(game_type: str = None, start_date: str = None, end_date: str
     )
     ax.axis('off')
 
-def plot_std_stats(player_id, start_dt, end_dt, season, ax, game_type = 'R'):
+def plot_std_stats(player_id, start_dt, end_dt, season, ax, game_type = 'R', game_logs = None):
     """
     Plots a table of selected stats from the DataFrame.
     
@@ -98,179 +244,215 @@ def plot_std_stats(player_id, start_dt, end_dt, season, ax, game_type = 'R'):
         df (pd.DataFrame): DataFrame containing the stats.
         ax (matplotlib.axes.Axes): Axis to plot the table on.
         stats_to_plot (list): List of stats to include in the table.
+        game_logs (pd.DataFrame): Prefetched game logs. Fetched if not provided.
         
     Returns:
         matplotlib.axes.Axes: The axis with the plotted table.
     """
-    # Define stats to plot
-    stats_to_plot = ['PA', 'R', 'HR', 'RBI', 'SB','AVG', 'OBP', 'SLG', 'OPS', 'K%', 'BB%']
-
     # Get game logs
-    data = get_filtered_game_logs(player_id, start_dt, end_dt, season, game_type)
+    data = game_logs
+    if data is None:
+        data = get_filtered_game_logs(player_id, start_dt, end_dt, season, game_type)
 
     # Process game logs
     df = process_game_logs(data)
 
     # Filter DataFrame
-    df = df[stats_to_plot]
+    df = df[STD_STATS]
     
     # Create table
-    table = ax.table(cellText=df.values, colLabels=df.columns, cellLoc='center', bbox=[0.0, 0.0, 1.0, 1.0])
-    
-    # Set font size
-    table.set_fontsize(25)
-    table.auto_set_font_size(False)
-    
-    # Make column headers bold
-    for i, cell in table.get_celld().items():
-        if i[0] == 0:
-            cell.set_text_props(weight='bold')
-    
-    # Hide the axes
-    ax.axis('off')
+    table = _draw_std_stats_table(ax, STD_STATS)
+    _update_std_stats_table(table, df)
     
     return ax
 
-def plot_percentiles(player_id: int, start_dt: str, end_dt: str, season: int, ax: plt.Axes):
+def plot_percentiles(player_id: int, start_dt: str, end_dt: str, season: int, ax: plt.Axes,
+                     raw_data: pd.DataFrame = None):
 
-    # Fetch and process player data
-    raw_data = get_savant_data(player_id, start_dt, end_dt)
-    processed_data = process_hitter_data(raw_data)
+    # Process prefetched pitches, or answer the range from the pitch cache's per-game aggregates
+    if raw_data is None:
+        processed_data = process_cached_hitter_data(player_id, start_dt, end_dt)
+    else:
+        processed_data = process_hitter_data(raw_data)
 
     # Convert processed data to a dictionary for percentile calculation
     player_stats = processed_data.iloc[0].to_dict()
 
     metrics = list(player_stats.keys())
 
-    # Define metrics where lower is better
-    lower_is_better = ['Whiff%', 'O-Swing%']
-    
-    # Load league stats
-    league_stats = pd.read_csv(f'data/clean{season}.csv')
+    # Calculate percentiles against the season's league table
+    percentiles = calculate_percentiles(processed_data, season).iloc[0].to_dict()
 
-    # Calculate percentiles
-    percentiles = {}
-    for metric in metrics:
-        if metric not in league_stats.columns:
-            continue  # Skip metrics not in league stats
+    # Plot bars and circles
+    chart = _draw_percentile_chart(ax, metrics)
+    _update_percentile_chart(chart, metrics, player_stats, percentiles)
 
-        # Calculate raw percentile
-        raw_percentile = percentileofscore(league_stats[metric], player_stats[metric], kind='mean')
-        adjusted_percentile = max(1, raw_percentile)  # Ensure at least 1st percentile
+    return ax
 
-        # Adjust for "lower is better" metrics
-        if metric in lower_is_better:
-            adjusted_percentile = max(1, 100 - adjusted_percentile)  # Ensure minimum is 1
-        percentiles[metric] = adjusted_percentile
+class BatterCardTemplate:
+    """
+    A hitter card's figure, layout, axes and static styling, built once and reused.
 
+    Each render only updates the data-dependent artists (headshot, logo, bio and
+    timeframe text, table cells and percentile bars/labels). The layout is computed
+    on the first render and kept for every card after it.
 
-    y_pos = np.arange(len(metrics))
+    Args:
+        pyplot (bool): Create the figure through pyplot (needed for plt.show()). Otherwise
+            the figure is headless on Agg and never enters pyplot's figure registry.
+    """
 
-    # Plot bars and circles
-    for i, metric in enumerate(metrics):
-        pct = percentiles[metric]
-        value = player_stats[metric]
-        color = get_savant_color(pct)
-        bar_height = 0.85
-
-        # Background gray bar
-        ax.barh(i, 100, color=PERCENTILE_COLORS['gray'], height = bar_height/4 , zorder=1)
-        
-        # Colored percentile bar
-        ax.barh(i, pct, color=color, height=bar_height, zorder=2)
-        
-        # Circle
-        ellipse = patches.Ellipse((pct, i), width= bar_height * 6.8,  # not sure why this works
-                                  height = bar_height, 
-                                facecolor=color, edgecolor = 'white', 
-                                linewidth=3, zorder=3)
-        ax.add_patch(ellipse)
-        
-        # Percentile text
-        font_size = 22 if pct == 100 else 27  # Adjust font size if percentile is 100
-        ax.text(pct, i, f'{int(pct)}', 
-                ha='center', va='center_baseline',
-                color='white', 
-                fontsize= font_size,
-                fontweight='bold',
-                zorder=4)
+    def __init__(self, pyplot: bool = False):
+        # Create a figure of size 20x20
+        if pyplot:
+            self.fig = plt.figure(figsize=(20, 20))
+        else:
+            self.fig = Figure(figsize=(20, 20))
+            FigureCanvasAgg(self.fig)
+        fig = self.fig
+
+        # Create a gridspec layout with 8 columns and 6 rows
+        gs = gridspec.GridSpec(8, 8,
+                            height_ratios=[3,6,3,4,8,8,8,2],
+                            width_ratios=[2,16,16,16,16,16,16,2])
+
+        # Define the position of each subplot in the grid
+        ax_headshot = fig.add_subplot(gs[1, 0:3])  # Top-left for headshot
+        ax_bio = fig.add_subplot(gs[1, 1:7])  # Space for bio
+        ax_logo = fig.add_subplot(gs[1, 5:9])  # Top-right for team logo
+        ax_timeframe = fig.add_subplot(gs[2, 1:7])  # Timeframe 
+        ax_player_stats = fig.add_subplot(gs[3, 1:7])  # Player stats
+        ax_savant = fig.add_subplot(gs[4:7, 1:7])  # Savant plot
+        ax_text = fig.add_subplot(gs[7, 5])  # Text
         
-        # Value text
-        value_text = (f'{value:.3f}'[1:] if metric in ['xBA', 'xSLG', 'xwOBA'] and value < 1
-                    else f'{value:.3f}' if metric in ['xBA', 'xSLG', 'xwOBA']
-                    else f'{value:.1f}' if metric == 'EV90'
-                    else f'{value:.1f}%')
-        ax.text(103, i, value_text,
-                ha='left', va='center',
-                fontsize=25)
-    
-    # Styling
-    ax.set_yticks(y_pos)
-    ax.set_yticklabels(metrics, fontsize=25, ha='right')
-    ax.set_xlim(-10, 110)
-    for label in ax.get_yticklabels():
-        label.set_x(.07)  # Adjust the value as needed
-    ax.set_xlabel("")
-    ax.grid(False)
-    ax.set_xticks([])  # Remove x-axis numbers
-    ax.spines['left'].set_visible(False)   # Remove left spine
-    ax.spines['right'].set_visible(False)  # Remove right spine
-    ax.spines['top'].set_visible(False)    # Remove top spine
-    ax.spines['bottom'].set_visible(False) # Remove bottom spine
-
-    return ax
+        # Hide the header, footer, and side borders for now
+        ax_footer = fig.add_subplot(gs[-1, 1:7])
+        ax_header = fig.add_subplot(gs[0, 1:7])
+        ax_left = fig.add_subplot(gs[:, 0])
+        ax_right = fig.add_subplot(gs[:, -1])
+
+        # Hide the axes for the borders
+        ax_footer.axis('off')
+        ax_header.axis('off')
+        ax_left.axis('off')
+        ax_right.axis('off')
+
+        # Data-dependent artists, created empty
+        self.headshot = _draw_image(ax_headshot)
+        self.bio = _draw_bio_text(ax_bio)
+        self.logo = _draw_image(ax_logo)
+        self.timeframe = ax_timeframe.text(0.5, 0.5, '', ha='center', va='center', fontsize=40)
+        ax_timeframe.axis('off')
+        self.std_stats = _draw_std_stats_table(ax_player_stats, STD_STATS)
+        self.percentiles = _draw_percentile_chart(ax_savant, PERCENTILE_METRICS)
+        ax_savant.set_anchor('E')
+
+        # Plot my X handle on the bottom right
+        ax_text.text(0, 0, "X: @AndreD_Stats", ha='center', va='center', fontsize=30)
+        ax_text.axis('off')
+
+        self._laid_out = False
+
+    def render(self, player_id: int, inputs: dict, game_type: str = None, start_date: str = None,
+               end_date: str = None, season: int = 2024) -> Figure:
+        """
+        Update the card with a player's data.
+
+        Args:
+            player_id (int): The player's MLB ID.
+            inputs (dict): The player's card inputs from fetch_card_inputs.
+            game_type (str): The game type.
+            start_date (str): Start date in "YYYY-MM-DD" format.
+            end_date (str): End date in "YYYY-MM-DD" format.
+            season (int): The season year.
+
+        Returns:
+            Figure: The template's figure, now showing the player's card.
+        """
+        # Headshot, bio, logo
+        self.headshot.set_data(inputs['headshot'])
+        _update_bio_text(self.bio, get_player_bio(player_id, inputs['context']))
+        if inputs['team_logo']:
+            self.logo.set_data(inputs['team_logo'])
+        else:
+            print("Failed to fetch team logo.")
+        self.logo.set_visible(bool(inputs['team_logo']))
+
+        # Timeframe label based on the game type
+        self.timeframe.set_text(get_timeframe(game_type, start_date, end_date, season))
+
+        # Player standard stats
+        _update_std_stats_table(self.std_stats, process_game_logs(inputs['game_logs'])[STD_STATS])
+
+        # Savant percentiles
+        processed_data = process_cached_hitter_data(player_id, start_date, end_date)[PERCENTILE_METRICS]
+        percentiles = calculate_percentiles(processed_data, season).iloc[0].to_dict()
+        _update_percentile_chart(self.percentiles, PERCENTILE_METRICS,
+                                 processed_data.iloc[0].to_dict(), percentiles)
+
+        # Ensure the layout is adjusted properly (once, with real data in place)
+        if not self._laid_out:
+            self.fig.tight_layout()
+            self._laid_out = True
+
+        return self.fig
+
+    def to_bytes(self, image_format: str = 'png', dpi: int = 300) -> bytes:
+        """
+        Encode the current card as an image.
+
+        Args:
+            image_format (str): Image format, e.g. 'png' or 'webp'.
+            dpi (int): Output resolution.
+
+        Returns:
+            bytes: The encoded image.
+        """
+        buf = BytesIO()
+        self.fig.savefig(buf, format=image_format, dpi=dpi, bbox_inches='tight')
+        return buf.getvalue()
+
+def make_batter_card(player_id, game_type=None, start_date= None, end_date=None, season=2024,
+                     output='show', dpi=300, template: BatterCardTemplate = None):
+    """
+    Builds a player's hitter card.
 
-def make_batter_card(player_id, game_type=None, start_date= None, end_date=None, season=2024):
-    # Create a figure of size 20x20
-    fig = plt.figure(figsize=(20, 20))
-    
-    # Create a gridspec layout with 8 columns and 6 rows
-    gs = gridspec.GridSpec(8, 8,
-                        height_ratios=[3,6,3,4,8,8,8,2],
-                        width_ratios=[2,16,16,16,16,16,16,2])
-
-    # Define the position of each subplot in the grid
-    ax_headshot = fig.add_subplot(gs[1, 0:3])  # Top-left for headshot
-    ax_bio = fig.add_subplot(gs[1, 1:7])  # Space for bio
-    ax_logo = fig.add_subplot(gs[1, 5:9])  # Top-right for team logo
-    ax_timeframe = fig.add_subplot(gs[2, 1:7])  # Timeframe 
-    ax_player_stats = fig.add_subplot(gs[3, 1:7])  # Player stats
-    ax_savant = fig.add_subplot(gs[4:7, 1:7])  # Savant plot
-    ax_text = fig.add_subplot(gs[7, 5])  # Text
-    
-    # Hide the header, footer, and side borders for now
-    ax_footer = fig.add_subplot(gs[-1, 1:7])
-    ax_header = fig.add_subplot(gs[0, 1:7])
-    ax_left = fig.add_subplot(gs[:, 0])
-    ax_right = fig.add_subplot(gs[:, -1])
-
-    # Hide the axes for the borders
-    ax_footer.axis('off')
-    ax_header.axis('off')
-    ax_left.axis('off')
-    ax_right.axis('off')
-    
-    # Plot the headshot, bio, logo (static)
-    plot_headshot(player_id, ax_headshot)
-    plot_player_bio(player_id, ax_bio)
-    plot_team_logo(player_id, ax_logo)
+    Args:
+        player_id (int): The player's MLB ID.
+        game_type (str): The game type.
+        start_date (str): Start date in "YYYY-MM-DD" format.
+        end_date (str): End date in "YYYY-MM-DD" format.
+        season (int): The season year.
+        output (str): 'show' to display the card with pyplot, 'figure' to return the
+            Figure, or 'png'/'webp' to return the encoded image bytes.
+        dpi (int): Resolution of the encoded image ('png'/'webp' only).
+        template (BatterCardTemplate): Template to render into, so batch runs reuse one
+            layout. A new one is built if not provided.
 
-    # Plot the timeframe label based on the game type
-    plot_timeframe(game_type=game_type, start_date=start_date, end_date=end_date, season=season, ax=ax_timeframe)    
-    
-    # Plot player standard stats 
-    plot_std_stats(player_id, start_dt=start_date, end_dt=end_date, 
-                   season=season, ax = ax_player_stats, game_type=game_type)    
-    
-    # Plot the Savant plot
-    plot_percentiles(player_id=player_id, start_dt=start_date, end_dt=end_date, season=season, ax=ax_savant)
-    ax_savant.set_anchor('E')
-
-    # Plot my X handle on the bottom right
-    ax_text.text(0, 0, "X: @AndreD_Stats", ha='center', va='center', fontsize=30)
-    ax_text.axis('off')
-
-    # Ensure the layout is adjusted properly
-    plt.tight_layout()
-    # Show the figure
-    plt.show()
\ No newline at end of file
+    Returns:
+        Figure, bytes or None: Depending on output.
+    """
+    if output not in ('show', 'figure', 'png', 'webp'):
+        raise ValueError(f"Unknown output: {output}")
+
+    # Outside of 'show', render headless on Agg with a figure pyplot doesn't track,
+    # so long-running processes don't accumulate figures
+    new_template = template is None
+    if new_template:
+        template = BatterCardTemplate(pyplot=(output == 'show'))
+
+    # Fetch every card input at once
+    inputs = fetch_card_inputs(player_id, start_date, end_date, season, game_type)
+    fig = template.render(player_id, inputs, game_type, start_date, end_date, season)
+
+    if output == 'show':
+        # Show the figure
+        plt.show()
+    elif output == 'figure':
+        return fig
+    else:
+        # Encode the card, and release the figure's artists right away if it was ours
+        card = template.to_bytes(output, dpi)
+        if new_template:
+            fig.clear()
+        return card
@@ -10,13 +10,12 @@ from PIL import Image
 from io import BytesIO
 import requests
 import datetime as dt
-import pybaseball as pyb
 
 # Import your custom modules
 from constants import *
 from config import *
 from plotting import plot_headshot, plot_player_bio, plot_team_logo, plot_timeframe, plot_std_stats, plot_percentiles, make_batter_card
-from utils import get_headshot, get_player_bio, get_team_logo, get_timeframe, get_savant_color, get_filtered_game_logs
+from utils import get_headshot, get_player_bio, get_team_logo, get_timeframe, get_savant_color, get_filtered_game_logs, search_players
 from data_processing import calculate_xBA, calculate_xSLG, calculate_xwOBA, process_game_logs, is_barrel, is_sweet_spot
 
 # Streamlit app configuration
@@ -79,11 +78,12 @@ start = start_date.strftime('%Y-%m-%d')
 end = end_date.strftime('%Y-%m-%d')
 
 # Main content area
-if first_name and last_name:
+if first_name or last_name:
     try:
-        # Player lookup
-        with st.spinner(f"Looking up {first_name} {last_name}..."):
-            player_lookup = pyb.playerid_lookup(last_name, first_name)
+        # Player lookup in the local name index; exact matches win over prefix and fuzzy ones
+        matches = search_players(first_name=first_name, last_name=last_name)
+        exact_matches = matches[matches['match'] == 'exact']
+        player_lookup = exact_matches if len(exact_matches) > 0 else matches
             
         if len(player_lookup) == 0:
             st.error(f"No player found with name: {first_name} {last_name}")
@@ -104,7 +104,8 @@ if first_name and last_name:
                             start_date=start,
                             end_date=end,
                             game_type=game_type,
-                            season=season
+                            season=season,
+                            output='figure'
                         )
                         
                         # Display the card
@@ -143,15 +144,16 @@ if first_name and last_name:
             st.write("Please select the correct player:")
             
             # Create a selection dataframe
-            display_df = player_lookup[['name_first', 'name_last', 'mlb_played_first', 'mlb_played_last']].copy()
-            display_df['Years Active'] = display_df['mlb_played_first'].astype(str) + ' - ' + display_df['mlb_played_last'].astype(str)
+            display_df = player_lookup[['name_first', 'name_last', 'team', 'pos', 'active']].copy()
+            display_df['Details'] = (display_df['pos'] + ', ' + display_df['team'].replace('', 'FA') + ', ' +
+                                     display_df['active'].map({True: 'active', False: 'inactive'}))
             display_df['Full Name'] = display_df['name_first'] + ' ' + display_df['name_last']
             
             # Player selection
             selected_player = st.selectbox(
                 "Select Player:",
                 options=range(len(display_df)),
-                format_func=lambda x: f"{display_df.iloc[x]['Full Name']} ({display_df.iloc[x]['Years Active']})"
+                format_func=lambda x: f"{display_df.iloc[x]['Full Name']} ({display_df.iloc[x]['Details']})"
             )
             
             if st.button("Generate Card for Selected Player", type="primary"):
@@ -165,7 +167,8 @@ if first_name and last_name:
                             start_date=start,
                             end_date=end,
                             game_type=game_type,
-                            season=season
+                            season=season,
+                            output='figure'
                         )
                         
                         st.pyplot(card_fig)
@@ -187,15 +190,15 @@ if first_name and last_name:
     
     except Exception as e:
         st.error(f"Error looking up player: {str(e)}")
-        st.error("Please make sure pybaseball is properly installed and configured.")
+        st.error(f"Please make sure {PLAYER_ID_MAP_PATH} is available.")
 
 else:
     # Instructions when no player is entered
-    st.info("👆 Enter a player's first and last name in the sidebar to get started")
+    st.info("👆 Enter a player's first and/or last name in the sidebar to get started")
     
     st.markdown("### How to use:")
     st.markdown("""
-    1. **Enter Player Information**: Type the player's first and last name in the sidebar
+    1. **Enter Player Information**: Type the player's first and/or last name in the sidebar (typos are OK)
     2. **Select Season**: Choose the season you want to analyze
     3. **Choose Game Type**: Regular season, playoffs, or World Series
     4. **Set Date Range**: Adjust the start and end dates if needed
@@ -1,14 +1,236 @@
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+import unicodedata
 import requests
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
 import pybaseball as pyb
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 from constants import *
 from PIL import Image
 from io import BytesIO
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
 
 
+def _build_http_session() -> requests.Session:
+    """
+    Build the shared HTTP session with pooled keep-alive connections and bounded retries.
+    """
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+        raise_on_status=False  # Hand the last response back so callers can inspect it
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Module-level session shared by every fetcher
+HTTP_SESSION = _build_http_session()
+
+# Per-host limits on requests in flight
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+
+# Process-wide limit on Statcast downloads in flight (see set_statcast_concurrency)
+_statcast_concurrency = STATCAST_MAX_WORKERS
+_statcast_semaphore = threading.BoundedSemaphore(_statcast_concurrency)
+
+def _reset_http_state():
+    """
+    Give a forked child process its own HTTP session and limiters.
+
+    A forked child inherits the parent's pooled keep-alive sockets. If parent and children
+    (or sibling workers) kept using them, their requests would interleave on one TCP stream.
+    """
+    global HTTP_SESSION, _host_semaphores, _host_semaphores_lock, _statcast_semaphore
+    HTTP_SESSION = _build_http_session()
+    _host_semaphores = {}
+    _host_semaphores_lock = threading.Lock()
+    _statcast_semaphore = threading.BoundedSemaphore(_statcast_concurrency)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_http_state)
+
+def _get_host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """Get (or create) the concurrency limiter for a URL's host."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(HTTP_MAX_CONCURRENCY_PER_HOST)
+        return _host_semaphores[host]
+
+def http_get(url: str, params: dict = None, timeout: tuple = HTTP_TIMEOUT, **kwargs) -> requests.Response:
+    """
+    Send a GET request through the shared, pooled HTTP session.
+
+    Args:
+    - url (str): The URL to request.
+    - params (dict): Query string parameters. Optional.
+    - timeout (tuple): (connect, read) timeout in seconds.
+
+    Returns:
+    - requests.Response: The response (after any retries).
+    """
+    with _get_host_semaphore(url):
+        return HTTP_SESSION.get(url, params=params, timeout=timeout, **kwargs)
+
+
+# Decoded, resized images keyed by URL, least recently used first, and their total size
+_image_cache = OrderedDict()
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+def _image_meta_path(url: str) -> str:
+    """Get the path of the metadata (content hash, ETag, Last-Modified) stored for a URL."""
+    url_hash = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(IMAGE_CACHE_DIR, 'meta', f'{url_hash}.json')
+
+def _image_blob_path(content_hash: str) -> str:
+    """Get the content-addressed path of an image's bytes."""
+    return os.path.join(IMAGE_CACHE_DIR, 'blobs', content_hash)
+
+def _write_atomic(path: str, data: bytes):
+    """Write a file via a temporary file so readers never see a partial write."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def _fetch_image_bytes(url: str) -> bytes:
+    """
+    Get an image's bytes from the on-disk store, revalidating with ETag/Last-Modified.
+
+    Falls back to the stored copy if the server can't be reached.
+    """
+    meta_path = _image_meta_path(url)
+    meta, blob_path = {}, None
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            meta = json.load(f)
+        blob_path = _image_blob_path(meta['sha256'])
+        if not os.path.exists(blob_path):
+            meta, blob_path = {}, None
+
+    # Ask the server whether our stored copy is still current
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    try:
+        response = http_get(url, headers=headers)
+    except requests.exceptions.RequestException:
+        if blob_path is None:
+            raise
+        response = None
+
+    if response is None or response.status_code == 304:
+        with open(blob_path, 'rb') as f:
+            return f.read()
+
+    response.raise_for_status()
+    content = response.content
+
+    # Store the bytes under their content hash, then point the URL at them
+    content_hash = hashlib.sha256(content).hexdigest()
+    blob_path = _image_blob_path(content_hash)
+    if not os.path.exists(blob_path):
+        _write_atomic(blob_path, content)
+    _write_atomic(meta_path, json.dumps({
+        'url': url,
+        'sha256': content_hash,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }).encode())
+
+    return content
+
+def _image_nbytes(img: Image) -> int:
+    """Get the size of a decoded image in memory."""
+    return img.width * img.height * len(img.getbands())
+
+def get_cached_image(url: str, keep_in_memory: bool = True) -> Image:
+    """
+    Fetch an image through the two-tier image cache.
+
+    Decoded, resized images are kept in an in-memory LRU bounded by IMAGE_CACHE_MAX_BYTES.
+    On a miss the bytes come from the on-disk store (revalidated with the server) or a fresh download.
+
+    Args:
+    - url (str): The image URL.
+    - keep_in_memory (bool): Whether to add the image to the in-memory tier. Images used once
+      (like headshots) skip it, so they don't evict the images every card reuses.
+
+    Returns:
+    - Image: The decoded image (RGBA, fit within IMAGE_MAX_SIZE). Shared between callers, don't modify it.
+    """
+    global _image_cache_bytes
+    with _image_cache_lock:
+        if url in _image_cache:
+            _image_cache.move_to_end(url)
+            return _image_cache[url]
+
+    # Decode once and downscale to the size the card needs
+    img = Image.open(BytesIO(_fetch_image_bytes(url))).convert('RGBA')
+    img.thumbnail(IMAGE_MAX_SIZE)
+
+    if not keep_in_memory:
+        return img
+
+    with _image_cache_lock:
+        if url in _image_cache:
+            # Another thread decoded it meanwhile; share its copy
+            _image_cache.move_to_end(url)
+            return _image_cache[url]
+        _image_cache[url] = img
+        _image_cache_bytes += _image_nbytes(img)
+        # Evict least recently used images until the cache fits (always keeping the newest)
+        while _image_cache_bytes > IMAGE_CACHE_MAX_BYTES and len(_image_cache) > 1:
+            _, evicted = _image_cache.popitem(last=False)
+            _image_cache_bytes -= _image_nbytes(evicted)
+
+    return img
+
+def prefetch_team_logos() -> dict:
+    """
+    Load every team logo in MLB_TEAM_LOGOS into the image cache at once.
+
+    Returns:
+    - dict: Team abbreviation -> logo image (None if a logo couldn't be fetched).
+    """
+    def fetch_logo(url):
+        try:
+            return get_cached_image(url)
+        except Exception as e:
+            print(f"An error occurred while fetching the team logo {url}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=HTTP_MAX_CONCURRENCY_PER_HOST) as executor:
+        logos = list(executor.map(fetch_logo, MLB_TEAM_LOGOS.values()))
+
+    return dict(zip(MLB_TEAM_LOGOS.keys(), logos))
+
 def get_headshot(player_id: int) -> Image:
     """
     Fetches the player's headshot image from the URL.
@@ -24,44 +246,75 @@ def get_headshot(player_id: int) -> Image:
         f'upload/d_people:generic:headshot:67:current.png/'\
         f'w_640,q_auto:best/v1/people/{player_id}/headshot/silo/current.png'
 
-    # Send a GET request to the URL
-    response = requests.get(url)
-    
-    # Ensure the request was successful
-    if response.status_code == 200:
-        img = Image.open(BytesIO(response.content))
-        return img
-    else:
+    # Fetch the image through the on-disk image cache; a headshot is rarely drawn twice in a process
+    try:
+        return get_cached_image(url, keep_in_memory=False)
+    except requests.exceptions.HTTPError:
         raise ValueError(f"Failed to fetch headshot for player ID {player_id}")
 
-def get_player_bio(player_id: str) -> dict:
+def get_player_context(player_id: str) -> dict:
     """
-    Fetch player bio data from MLB API.
+    Fetch the player's people record (with current team hydrated) from the MLB API.
+
+    The context is fetched once per card and shared by get_player_bio and
+    get_team_logo, so a card makes a single metadata request.
 
     Args:
     - player_id (str): The unique player ID.
 
     Returns:
-    - dict: A dictionary containing the player bio information.
+    - dict: A dictionary with the player ID, the raw people record and the
+      current team abbreviation, or None if the request failed.
     """
     try:
-        # Construct the URL to fetch player bio
-        url = f'https://statsapi.mlb.com/api/v1/people?'\
-              f'personIds={player_id}&hydrate=currentTeam'
-
-        # Send the GET request to fetch the data
-        response = requests.get(url)
-        response.raise_for_status()  # Raises an HTTPError for bad responses (4xx, 5xx)
-
-        # Parse the JSON response
+        # Hydrate the current team so the abbreviation comes back with the player
+        url = f'{MLB_API_URL}?personIds={player_id}&hydrate=currentTeam'
+        response = http_get(url)
+        response.raise_for_status()
         data = response.json()
 
-        # Check if the response contains the expected data
         if 'people' not in data or not data['people']:
             raise ValueError(f"No player data found for ID {player_id}")
+        person = data['people'][0]
+
+        # Fall back to the team ID mapping if the abbreviation is missing or unknown
+        current_team = person.get('currentTeam', {})
+        team_abbreviation = current_team.get('abbreviation')
+        if team_abbreviation not in MLB_TEAM_LOGOS:
+            team_abbreviation = TEAM_ABBREVIATIONS.get(str(current_team.get('id')), team_abbreviation)
+
+        return {
+            "player_id": player_id,
+            "person": person,
+            "team_abbreviation": team_abbreviation
+        }
+
+    except requests.exceptions.RequestException as e:
+        print(f"Error with the request: {e}")
+    except ValueError as e:
+        print(f"Error processing player data: {e}")
+    return None
+
+def get_player_bio(player_id: str, context: dict = None) -> dict:
+    """
+    Fetch player bio data from MLB API.
+
+    Args:
+    - player_id (str): The unique player ID.
+    - context (dict): Player context from get_player_context. Fetched if not provided.
+
+    Returns:
+    - dict: A dictionary containing the player bio information.
+    """
+    try:
+        # Fetch the player context if it wasn't shared by the caller
+        if context is None:
+            context = get_player_context(player_id)
+        if context is None:
+            raise ValueError(f"No player data found for ID {player_id}")
 
         # Extract player information
-        player_info = data['people'][0]
+        player_info = context['person']
         primary_position = player_info.get('primaryPosition', {}).get('abbreviation', 'N/A')
         player_name = player_info.get('fullName', 'N/A')
         team = player_info.get('currentTeam', {}).get('name', 'N/A')
@@ -94,42 +347,32 @@ def get_player_bio(player_id: str) -> dict:
             "age": age
         }
 
-    except requests.exceptions.RequestException as e:
-        print(f"Error with the request: {e}")
     except ValueError as e:
         print(f"Error processing player data: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
     return None  # Return None if any error occurred
 
-def get_team_logo(player_id: str) -> Image:
+def get_team_logo(player_id: str, context: dict = None) -> Image:
     """
     Fetches the logo of a player's current MLB team.
 
     Args:
         player_id (str): The player's MLB ID.
+        context (dict): Player context from get_player_context. Fetched if not provided.
 
     Returns:
         Image: The team's logo image (PIL Image) if successful, or None if there's an error.
     """
     try:
-        # Fetch player data
-        url = f"https://statsapi.mlb.com/api/v1/people?personIds={player_id}&hydrate=currentTeam"
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an error for bad responses
-        data = response.json()
-
-        # Get team abbreviation from player data
-        team_link = data['people'][0].get('currentTeam', {}).get('link', None)
-        if not team_link:
-            raise ValueError("Team link not found for player.")
-
-        team_url = f"https://statsapi.mlb.com{team_link}"
-        team_response = requests.get(team_url)
-        team_response.raise_for_status()  # Raise an error for bad responses
-        team_data = team_response.json()
+        # Fetch the player context if it wasn't shared by the caller
+        if context is None:
+            context = get_player_context(player_id)
+        if context is None:
+            raise ValueError(f"No player data found for ID {player_id}")
 
-        team_abbreviation = team_data['teams'][0].get('abbreviation', None)
+        # Get team abbreviation from the hydrated current team
+        team_abbreviation = context.get('team_abbreviation')
         if not team_abbreviation:
             raise ValueError("Team abbreviation not found.")
 
@@ -139,15 +382,178 @@ def get_team_logo(player_id: str) -> Image:
             raise ValueError(f"Logo URL not found for team: {team_abbreviation}")
 
         # Fetch and return the team logo
-        logo_response = requests.get(logo_url)
-        logo_response.raise_for_status()  # Raise an error for bad responses
-        img = Image.open(BytesIO(logo_response.content))
-        return img
+        return get_cached_image(logo_url)
 
     except Exception as e:
         print(f"An error occurred while fetching the team logo: {e}")
         return None  # Return None if there's an error
     
+def get_team_hitters(team_abbreviation: str, season: int = 2024) -> list:
+    """
+    Fetch the MLB IDs of a team's position players for a season.
+
+    Args:
+        team_abbreviation (str): The team abbreviation (a key of MLB_TEAM_LOGOS).
+        season (int): The season year.
+
+    Returns:
+        list: MLB IDs of every non-pitcher on the team's roster.
+    """
+    team_ids = {abbreviation: team_id for team_id, abbreviation in TEAM_ABBREVIATIONS.items()}
+    team_id = team_ids.get(team_abbreviation.upper())
+    if team_id is None:
+        raise ValueError(f"Unknown team: {team_abbreviation}")
+
+    url = f"https://statsapi.mlb.com/api/v1/teams/{team_id}/roster"
+    response = http_get(url, params={"rosterType": "fullSeason", "season": season})
+    response.raise_for_status()
+
+    return [player['person']['id'] for player in response.json().get('roster', [])
+            if player.get('position', {}).get('type') != 'Pitcher']
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a player name for searching: strip accents, lowercase, drop periods and
+    apostrophes ("A.J." -> "aj") and collapse everything else that isn't a letter or digit to single spaces.
+    """
+    name = unicodedata.normalize('NFKD', str(name))
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower()
+    name = re.sub(r"[.'’]", '', name)
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', name).split())
+
+def _name_trigrams(name: str) -> set:
+    """Character trigrams of a normalized name, padded so word starts and ends count."""
+    padded = f'  {name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+# Player search index: (file mtime, index dict)
+_player_index = None
+_player_index_lock = threading.Lock()
+
+def get_player_index() -> dict:
+    """
+    Build (once per process, or when the file changes) the player name index from PLAYER_ID_MAP_PATH.
+
+    Returns:
+    - dict: 'players' (DataFrame of key_mlbam, name_first, name_last, team, pos, active, in index
+      order), 'names' (normalized full names), sorted prefix keys 'full_keys'/'last_keys' with the
+      player rows they point to in 'full_rows'/'last_rows', and 'trigrams' (trigram -> player rows).
+    """
+    global _player_index
+    mtime = os.stat(PLAYER_ID_MAP_PATH).st_mtime_ns
+
+    with _player_index_lock:
+        if _player_index is not None and _player_index[0] == mtime:
+            return _player_index[1]
+
+        id_map = pd.read_csv(PLAYER_ID_MAP_PATH, usecols=['MLBID', 'PLAYERNAME', 'FIRSTNAME', 'LASTNAME',
+                                                         'TEAM', 'POS', 'ACTIVE'])
+        id_map = id_map.dropna(subset=['MLBID', 'PLAYERNAME']).drop_duplicates('MLBID')
+        players = pd.DataFrame({
+            'key_mlbam': id_map['MLBID'].astype(np.int64).to_numpy(),
+            'name_first': id_map['FIRSTNAME'].fillna('').to_numpy(),
+            'name_last': id_map['LASTNAME'].fillna('').to_numpy(),
+            'team': id_map['TEAM'].fillna('').to_numpy(),
+            'pos': id_map['POS'].fillna('').to_numpy(),
+            'active': (id_map['ACTIVE'] == 'Y').to_numpy()
+        })
+
+        names = np.array([normalize_name(name) for name in id_map['PLAYERNAME']])
+        last_names = np.array([normalize_name(name) for name in players['name_last']])
+
+        # Sorted keys for prefix search by binary search
+        full_rows = np.argsort(names, kind='stable')
+        last_rows = np.argsort(last_names, kind='stable')
+
+        # Trigram posting lists for fuzzy search
+        postings = {}
+        for row, name in enumerate(names):
+            for trigram in _name_trigrams(name):
+                postings.setdefault(trigram, []).append(row)
+
+        index = {
+            'players': players,
+            'names': names,
+            'full_keys': names[full_rows], 'full_rows': full_rows,
+            'last_keys': last_names[last_rows], 'last_rows': last_rows,
+            'trigrams': {trigram: np.array(rows) for trigram, rows in postings.items()},
+            'trigram_counts': np.array([len(_name_trigrams(name)) for name in names])
+        }
+        _player_index = (mtime, index)
+        return index
+
+def _prefix_rows(keys: np.ndarray, rows: np.ndarray, prefix: str) -> np.ndarray:
+    """Player rows whose sorted key starts with the prefix."""
+    first = np.searchsorted(keys, prefix, side='left')
+    last = np.searchsorted(keys, prefix + '\uffff', side='left')
+    return rows[first:last]
+
+def _search_player_rows(query: str, limit: int, active_only: bool) -> tuple:
+    """Rank the player index rows matching a query: (rows, match groups, scores), best first."""
+    index = get_player_index()
+    active = index['players']['active'].to_numpy()
+    query = normalize_name(query)
+    if not query:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp), np.array([])
+
+    # Fuzzy: share of trigrams in common (Dice coefficient), counted over the posting lists
+    query_trigrams = _name_trigrams(query)
+    postings = [index['trigrams'][t] for t in query_trigrams if t in index['trigrams']]
+    shared = np.bincount(np.concatenate(postings), minlength=len(active)) if postings else np.zeros(len(active))
+    score = 2 * shared / (len(query_trigrams) + index['trigram_counts'])
+
+    # Match groups, best last: fuzzy (similar enough), prefix of the full or last name, exact
+    group = np.where(score >= PLAYER_SEARCH_MIN_SIMILARITY, 0, -1)
+    full_prefix = _prefix_rows(index['full_keys'], index['full_rows'], query)
+    group[_prefix_rows(index['last_keys'], index['last_rows'], query)] = 1
+    group[full_prefix] = 1
+    group[full_prefix[index['names'][full_prefix] == query]] = 2
+
+    candidates = np.flatnonzero(group >= 0)
+    if active_only:
+        candidates = candidates[active[candidates]]
+
+    # Best match group first, then active players, then most similar
+    rows = candidates[np.lexsort((-score[candidates], ~active[candidates], -group[candidates]))][:limit]
+    return rows, group[rows], score[rows]
+
+def search_players(query: str = None, first_name: str = None, last_name: str = None,
+                   limit: int = 10, active_only: bool = False) -> pd.DataFrame:
+    """
+    Look up players by name in the local player index, with no network calls.
+
+    Names are compared normalized (see normalize_name). Exact full-name matches rank
+    first, then names or last names starting with the query, then fuzzy matches by
+    trigram similarity (so typos still find the player). Active players rank ahead of
+    inactive ones within each group.
+
+    Args:
+    - query (str): Full or partial name. Built from first_name and last_name if not given.
+    - first_name (str): First name. Optional.
+    - last_name (str): Last name. Optional.
+    - limit (int): Maximum number of players to return.
+    - active_only (bool): Only return active players.
+
+    Returns:
+    - pd.DataFrame: Matches with key_mlbam, name_first, name_last, team, pos, active,
+      match ('exact', 'prefix' or 'fuzzy') and score, best first.
+    """
+    if query is None:
+        query = f"{first_name or ''} {last_name or ''}"
+
+    rows, group, score = _search_player_rows(query, limit, active_only)
+    matches = get_player_index()['players'].iloc[rows].reset_index(drop=True)
+    matches['match'] = np.array(['fuzzy', 'prefix', 'exact'])[group]
+    matches['score'] = score
+    return matches
+
+def lookup_player_ids(query: str, limit: int = 10, active_only: bool = False) -> list:
+    """
+    search_players without building a DataFrame: just the MLB IDs of the matches, best first.
+    """
+    rows, _, _ = _search_player_rows(query, limit, active_only)
+    return get_player_index()['players']['key_mlbam'].to_numpy()[rows].tolist()
+
 def get_timeframe(game_type: str = None, start_date: str = None, end_date: str = None, season: int = 2024):
     """
     Generates the timeframe label based on the provided inputs.
@@ -187,18 +593,16 @@ def get_timeframe(game_type: str = None, start_date: str = None, end_date: str =
     else:
         return "Timeframe not specified"
     
-def get_filtered_game_logs(player_id: int, start_date: str = None, end_date: str = None, season: int = 2024, game_type: str = 'R'):
+# Parsed season game logs keyed by (player_id, season, game_type): (fetched time, DataFrame indexed by Date)
+_game_log_cache = {}
+_game_log_cache_lock = threading.Lock()
+
+def _fetch_season_game_logs(player_id: int, season: int, game_type: str) -> pd.DataFrame:
     """
-    Fetches and filters game logs for a player based on optional date ranges.
-    
-    Args:
-        player_id (int): The player's MLB ID.
-        start_date (str): Start date in "YYYY-MM-DD" format. Optional.
-        end_date (str): End date in "YYYY-MM-DD" format. Optional.
-        season (int): The season year.
-        
+    Fetches a player's full season game log from the stats API.
+
     Returns:
-        pd.DataFrame: A DataFrame containing the filtered game logs.
+        pd.DataFrame: One row per game, indexed by a sorted DatetimeIndex named 'Date'.
     """
     url = f"https://statsapi.mlb.com/api/v1/people/{player_id}/stats"
     params = {
@@ -209,7 +613,7 @@ def get_filtered_game_logs(player_id: int, start_date: str = None, end_date: str
     }
     
     # Fetch game logs from the API
-    response = requests.get(url, params=params)
+    response = http_get(url, params=params)
     if response.status_code != 200:
         raise ValueError(f"Failed to fetch game logs for player ID {player_id}: {response.text}")
     
@@ -220,56 +624,640 @@ def get_filtered_game_logs(player_id: int, start_date: str = None, end_date: str
     except (IndexError, KeyError):
         raise ValueError(f"No game logs found for player ID {player_id}")    
     
-    # Collect rows in a list
-    rows = []
+    return _parse_game_log_splits(game_logs)
+
+def _parse_game_log_splits(game_logs: list) -> pd.DataFrame:
+    """
+    Parses the splits of a stats API gameLog into a DataFrame.
+
+    Returns:
+        pd.DataFrame: One row per game, indexed by a sorted DatetimeIndex named 'Date'.
+    """
+    # Build each column straight from the splits: per-game counts fit in int16
+    n = len(game_logs)
+    dates = np.fromiter((game['date'] for game in game_logs), dtype='datetime64[D]', count=n)
+    columns = {
+        column: np.fromiter((game['stat'].get(field, 0) for game in game_logs), dtype=np.int16, count=n)
+        for column, field in GAME_LOG_FIELDS.items()
+    }
     
-    for game in game_logs:
-        stats = game["stat"]
-        rows.append({
-            'Date': game['date'],
-            'G': stats.get('gamesPlayed', 0),
-            'PA': stats.get('plateAppearances', 0),
-            'AB': stats.get('atBats', 0),
-            'H': stats.get('hits', 0),
-            '2B': stats.get('doubles', 0),
-            '3B': stats.get('triples', 0),
-            'HR': stats.get('homeRuns', 0),
-            'R': stats.get('runs', 0),
-            'RBI': stats.get('rbi', 0),
-            'IBB': stats.get('intentionalWalks', 0),
-            'BB': stats.get('baseOnBalls', 0),
-            'SO': stats.get('strikeOuts', 0),
-            'HBP': stats.get('hitByPitch', 0),
-            'SB': stats.get('stolenBases', 0),
-            'CS': stats.get('caughtStealing', 0),
-            'SF': stats.get('sacFlies', 0)
-        })
+    # Index and sort by date for slicing
+    game_logs_df = pd.DataFrame(columns, index=pd.DatetimeIndex(dates, name='Date'))
+    if not game_logs_df.index.is_monotonic_increasing:
+        game_logs_df = game_logs_df.sort_index(kind='stable')
     
-    # Create DataFrame from rows
-    game_logs_df = pd.DataFrame(rows)
+    return game_logs_df
+
+def get_season_game_logs(player_id: int, season: int = 2024, game_type: str = 'R') -> pd.DataFrame:
+    """
+    Gets a player's full season game log, downloading it only on a cache miss.
+
+    A completed season is cached for the life of the process. An in-progress season
+    is refetched once its cached copy is older than GAME_LOG_FRESHNESS_HOURS.
+
+    Args:
+        player_id (int): The player's MLB ID.
+        season (int): The season year.
+        game_type (str): The game type.
+
+    Returns:
+        pd.DataFrame: The cached game log, indexed by a sorted DatetimeIndex. Do not modify it.
+    """
+    game_logs_df = _get_cached_game_logs(player_id, season, game_type)
+    if game_logs_df is None:
+        fetched = dt.now()
+        game_logs_df = _fetch_season_game_logs(player_id, season, game_type)
+        _cache_game_logs(player_id, season, game_type, game_logs_df, fetched)
+    return game_logs_df
+
+def _get_cached_game_logs(player_id: int, season: int, game_type: str) -> pd.DataFrame:
+    """Get a cached season game log, or None if it is missing or stale."""
+    with _game_log_cache_lock:
+        cached = _game_log_cache.get((int(player_id), int(season), game_type))
+    if cached is None:
+        return None
+    fetched, game_logs_df = cached
+    if _season_is_complete(season) or dt.now() - fetched < timedelta(hours=GAME_LOG_FRESHNESS_HOURS):
+        return game_logs_df
+    return None
+
+def _cache_game_logs(player_id: int, season: int, game_type: str, game_logs_df: pd.DataFrame, fetched: dt):
+    """Store a parsed season game log fetched at the given time."""
+    with _game_log_cache_lock:
+        _game_log_cache[(int(player_id), int(season), game_type)] = (fetched, game_logs_df)
+
+def get_filtered_game_logs(player_id: int, start_date: str = None, end_date: str = None, season: int = 2024, game_type: str = 'R'):
+    """
+    Fetches and filters game logs for a player based on optional date ranges.
     
-    # Filter game logs by date range
-    game_logs_df['Date'] = pd.to_datetime(game_logs_df['Date'])
-    filtered_logs = game_logs_df[(game_logs_df['Date'] >= start_date) & (game_logs_df['Date'] <= end_date)]
+    Args:
+        player_id (int): The player's MLB ID.
+        start_date (str): Start date in "YYYY-MM-DD" format. Optional.
+        end_date (str): End date in "YYYY-MM-DD" format. Optional.
+        season (int): The season year.
+        game_type (str): The game type.
+        
+    Returns:
+        pd.DataFrame: A DataFrame containing the filtered game logs.
+    """
+    game_logs_df = get_season_game_logs(player_id, season, game_type)
+    
+    # Filter game logs by date range (inclusive slice of the sorted index)
+    filtered_logs = game_logs_df.loc[start_date:end_date]
     
-    return filtered_logs
+    return filtered_logs.reset_index()
 
-def get_savant_data(player_id: int, start_dt: str, end_dt: str) -> pd.DataFrame:
+def _fetch_bulk_game_logs(player_ids: list, season: int, game_type: str) -> dict:
     """
-    Fetch raw hitter data using pybaseball.
+    Fetches the season game logs of many players with one hydrated people request.
+
+    Returns:
+        dict: Parsed game logs keyed by player ID, for every player in the response.
+    """
+    url = "https://statsapi.mlb.com/api/v1/people"
+    params = {
+        "personIds": ','.join(str(player_id) for player_id in player_ids),
+        "hydrate": f"stats(group=[hitting],type=[gameLog],season={season},gameType=[{game_type}])"
+    }
+
+    response = http_get(url, params=params)
+    if response.status_code != 200:
+        raise ValueError(f"Failed to fetch game logs for {len(player_ids)} players: {response.text}")
+
+    game_logs = {}
+    for person in response.json().get('people', []):
+        # Players without games in the season come back without a gameLog entry
+        splits = next((stats.get('splits', []) for stats in person.get('stats', [])
+                       if stats.get('type', {}).get('displayName') == 'gameLog'), [])
+        game_logs[person['id']] = _parse_game_log_splits(splits)
+    return game_logs
+
+def get_bulk_game_logs(player_ids: list, start_date: str = None, end_date: str = None, season: int = 2024,
+                       game_type: str = 'R', chunk_size: int = GAME_LOG_BULK_CHUNK_SIZE,
+                       max_workers: int = GAME_LOG_MAX_WORKERS) -> pd.DataFrame:
+    """
+    Fetches and filters game logs for many players at once.
+
+    Players are hydrated in chunks of chunk_size per request. Any player missing from a
+    bulk response, or in a chunk whose request failed, is fetched on their own. All
+    requests share a pool of max_workers threads, and every parsed season goes
+    through the same cache as get_season_game_logs.
+
+    Args:
+        player_ids (list): The players' MLB IDs.
+        start_date (str): Start date in "YYYY-MM-DD" format. Optional.
+        end_date (str): End date in "YYYY-MM-DD" format. Optional.
+        season (int): The season year.
+        game_type (str): The game type.
+        chunk_size (int): Players per bulk request.
+        max_workers (int): Number of requests in flight at once.
+
+    Returns:
+        pd.DataFrame: Long-format game logs with a player_id column, one row per player per game.
+    """
+    player_ids = list(dict.fromkeys(int(player_id) for player_id in player_ids))
+
+    # Serve what we can from the cache
+    season_logs = {}
+    for player_id in player_ids:
+        cached = _get_cached_game_logs(player_id, season, game_type)
+        if cached is not None:
+            season_logs[player_id] = cached
+    missing = [player_id for player_id in player_ids if player_id not in season_logs]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = dt.now()
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        futures = {executor.submit(_fetch_bulk_game_logs, chunk, season, game_type): chunk for chunk in chunks}
+        for future, chunk in futures.items():
+            try:
+                for player_id, game_logs_df in future.result().items():
+                    _cache_game_logs(player_id, season, game_type, game_logs_df, fetched)
+                    season_logs[player_id] = game_logs_df
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Bulk game log request failed, fetching {len(chunk)} players one at a time: {e}")
+
+        # Fall back to one request per player for anyone the bulk requests did not return
+        fallback = [player_id for player_id in missing if player_id not in season_logs]
+        futures = {executor.submit(get_season_game_logs, player_id, season, game_type): player_id
+                   for player_id in fallback}
+        for future, player_id in futures.items():
+            try:
+                season_logs[player_id] = future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Error fetching game logs for player ID {player_id}: {e}")
+
+    frames = []
+    for player_id in player_ids:
+        if player_id not in season_logs:
+            continue
+        game_logs_df = season_logs[player_id].loc[start_date:end_date].reset_index()
+        game_logs_df.insert(0, 'player_id', player_id)
+        frames.append(game_logs_df)
+
+    if not frames:
+        empty = _parse_game_log_splits([]).reset_index()
+        empty.insert(0, 'player_id', np.array([], dtype=np.int64))
+        return empty
+    return pd.concat(frames, ignore_index=True)
+
+def get_savant_data(player_id: int, start_dt: str, end_dt: str, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Fetch raw hitter data using pybaseball, backed by the local pitch cache.
+
+    Only the dates in the range that aren't already cached (or have gone stale)
+    are downloaded; the requested range is then answered from disk.
 
     Args:
     - player_id (int): The unique player ID.
     - start_dt (str): The start date in "YYYY-MM-DD" format.
     - end_dt (str): The end date in "YYYY-MM-DD" format.
+    - use_cache (bool): Read from and write to the local pitch cache.
 
     Returns:
     - pd.DataFrame: A DataFrame containing the raw hitter data.
 
     """
-    # Later rework to download data faster (concurrent requests)
+    if not use_cache:
+        return download_savant_data(player_id, [(start_dt, end_dt)])
+
+    # The cache is partitioned by season, so answer each season separately
+    frames = [_get_cached_season_data(player_id, season, season_start, season_end)
+              for season, season_start, season_end in _season_ranges(start_dt, end_dt)]
+
+    # Re-compact, since concatenating categoricals with different categories falls back to object
+    return compact_statcast(pd.concat(frames, ignore_index=True))
+
+def _season_is_complete(season: int) -> bool:
+    """Check whether a season has finished, so its cached data can never change."""
+    today = dt.today().strftime('%Y-%m-%d')
+    if season in SEASON_DATES:
+        return today > SEASON_DATES[season]['POST_END']
+    return season < dt.today().year
+
+def _pitch_cache_paths(player_id: int, season: int) -> tuple:
+    """Get the Parquet data path and the legacy JSON coverage path for a player's season."""
+    season_dir = os.path.join(STATCAST_CACHE_DIR, str(season))
+    return (os.path.join(season_dir, f'{player_id}.parquet'),
+            os.path.join(season_dir, f'{player_id}.json'))
+
+def get_pitch_cache_path(player_id: int, season: int) -> str:
+    """Get the Parquet file holding a player's cached pitches for a season (it may not exist yet)."""
+    return _pitch_cache_paths(player_id, season)[0]
+
+def _missing_dates(dates: list, fetched: dict, season: int) -> list:
+    """
+    Find the dates that still need to be downloaded.
+
+    A fetched date is settled (valid forever) if its season is complete or it was
+    fetched at least STATCAST_SETTLE_DAYS after the game, once Savant has finalized it.
+    Other fetched dates are refetched once their copy is older than the freshness window.
+    """
+    if _season_is_complete(season):
+        return [d for d in dates if d not in fetched]
+
+    cutoff = dt.now() - timedelta(hours=STATCAST_FRESHNESS_HOURS)
+    missing = []
+    for d in dates:
+        if d not in fetched:
+            missing.append(d)
+            continue
+        fetched_at = dt.fromisoformat(fetched[d])
+        settled = fetched_at - dt.strptime(d, '%Y-%m-%d') >= timedelta(days=STATCAST_SETTLE_DAYS)
+        if not settled and fetched_at < cutoff:
+            missing.append(d)
+    return missing
+
+def _date_ranges(dates: list) -> list:
+    """Group sorted "YYYY-MM-DD" dates into contiguous (start, end) ranges."""
+    ranges = []
+    for date in dates:
+        day = dt.strptime(date, '%Y-%m-%d')
+        if ranges and dt.strptime(ranges[-1][1], '%Y-%m-%d') + timedelta(days=1) == day:
+            ranges[-1][1] = date
+        else:
+            ranges.append([date, date])
+    return [tuple(r) for r in ranges]
+
+def _season_ranges(start_dt: str, end_dt: str) -> list:
+    """Split a date range at year boundaries into (season, start, end) tuples, since the cache is per season."""
+    start_year = dt.strptime(start_dt, '%Y-%m-%d').year
+    end_year = dt.strptime(end_dt, '%Y-%m-%d').year
+    return [(season, max(start_dt, f'{season}-01-01'), min(end_dt, f'{season}-12-31'))
+            for season in range(start_year, end_year + 1)]
+
+# Parquet metadata key holding a season file's coverage ({date: fetch time})
+_PITCH_CACHE_COVERAGE_KEY = b'statcast_fetched'
+
+# Per (player_id, season) locks serializing pitch cache updates within the process
+_pitch_cache_locks = {}
+_pitch_cache_locks_lock = threading.Lock()
+
+def _get_pitch_cache_lock(player_id: int, season: int) -> threading.Lock:
+    """Get (or create) the update lock of a player's season in the pitch cache."""
+    key = (int(player_id), int(season))
+    with _pitch_cache_locks_lock:
+        if key not in _pitch_cache_locks:
+            _pitch_cache_locks[key] = threading.Lock()
+        return _pitch_cache_locks[key]
+
+def _read_pitch_cache_coverage(data_path: str, meta_path: str) -> dict:
+    """
+    Read which dates a season file covers, from its Parquet metadata (only the file footer is read).
+    Files written before the coverage moved into the Parquet file fall back to their JSON sidecar.
+    """
+    if os.path.exists(data_path):
+        metadata = pq.read_schema(data_path).metadata or {}
+        if _PITCH_CACHE_COVERAGE_KEY in metadata:
+            return json.loads(metadata[_PITCH_CACHE_COVERAGE_KEY])
+    if os.path.exists(meta_path):
+        with open(meta_path) as f:
+            return json.load(f)['fetched']
+    return {}
+
+def _update_season_cache(player_id: int, season: int, start_dt: str, end_dt: str) -> pd.DataFrame:
+    """
+    Download the dates of a range within one season that the pitch cache is missing.
+
+    The pitches and the dates they cover are stored in the same Parquet file, so a
+    single atomic replace updates both; concurrent updates of the same season within
+    the process are serialized. Only the file footer is read when nothing is missing.
+
+    Returns:
+    - pd.DataFrame: The updated season if it had to be loaded, otherwise None.
+    """
+    data_path, meta_path = _pitch_cache_paths(player_id, season)
+
+    with _get_pitch_cache_lock(player_id, season):
+        fetched = _read_pitch_cache_coverage(data_path, meta_path)
+
+        # Never mark dates that haven't happened yet as fetched
+        today = dt.today().strftime('%Y-%m-%d')
+        dates = [d.strftime('%Y-%m-%d') for d in pd.date_range(start_dt, min(end_dt, today))]
+        missing = _missing_dates(dates, fetched, season)
+        if not missing:
+            return None
+
+        fetched_at = dt.now().isoformat(timespec='seconds')
+        new_data = download_savant_data(player_id, _date_ranges(missing))
+
+        # Load what we already have (caches written before the compact frame are compacted on read),
+        # replacing any stale rows for the refetched dates
+        cached = compact_statcast(pd.read_parquet(data_path)) if os.path.exists(data_path) else pd.DataFrame()
+        if not cached.empty:
+            cached = cached[~cached['game_date'].isin(missing)]
+        cached = compact_statcast(pd.concat([cached, new_data], ignore_index=True))
+        if cached.columns.empty:
+            # Nothing cached or downloaded yet: still write the (empty) season to record its coverage
+            cached = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in STATCAST_COLUMNS.items()})
+
+        # Persist the season with its coverage, replaced atomically so a crash or a
+        # concurrent writer never leaves a truncated or mismatched file behind
+        fetched.update({d: fetched_at for d in missing})
+        table = pa.Table.from_pandas(cached, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               _PITCH_CACHE_COVERAGE_KEY: json.dumps(fetched).encode()})
+        buffer = BytesIO()
+        pq.write_table(table, buffer)
+        _write_atomic(data_path, buffer.getvalue())
+        if os.path.exists(meta_path):
+            os.remove(meta_path)  # Coverage now lives in the Parquet file
+
+        return cached
+
+def update_savant_cache(player_id: int, start_dt: str, end_dt: str):
+    """
+    Make sure the pitch cache covers a date range, downloading only missing or stale dates.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - start_dt (str): The start date in "YYYY-MM-DD" format.
+    - end_dt (str): The end date in "YYYY-MM-DD" format.
+    """
+    for season, season_start, season_end in _season_ranges(start_dt, end_dt):
+        _update_season_cache(player_id, season, season_start, season_end)
+
+def _get_cached_season_data(player_id: int, season: int, start_dt: str, end_dt: str) -> pd.DataFrame:
+    """
+    Answer a date range within one season from the pitch cache, downloading missing dates first.
+    """
+    cached = _update_season_cache(player_id, season, start_dt, end_dt)
+    if cached is None:
+        data_path = get_pitch_cache_path(player_id, season)
+        cached = compact_statcast(pd.read_parquet(data_path)) if os.path.exists(data_path) else pd.DataFrame()
+
+    if cached.empty:
+        return cached
+
+    return cached[(cached['game_date'] >= start_dt) & (cached['game_date'] <= end_dt)]
+
+def split_savant_date_range(start_dt: str, end_dt: str) -> list:
+    """
+    Split a date range into month-long chunks aligned to SEASON_DATES.
+
+    Each season is clipped to its spring training start and postseason end, so
+    off-season dates are never requested.
+
+    Args:
+    - start_dt (str): The start date in "YYYY-MM-DD" format.
+    - end_dt (str): The end date in "YYYY-MM-DD" format.
+
+    Returns:
+    - list: Ordered (start, end) date string tuples.
+    """
+    chunks = []
+    start_year = dt.strptime(start_dt, '%Y-%m-%d').year
+    end_year = dt.strptime(end_dt, '%Y-%m-%d').year
+    for season in range(start_year, end_year + 1):
+        # Clip the range to the season's window (whole year if the season is unknown)
+        season_dates = SEASON_DATES.get(season, {})
+        season_start = max(start_dt, season_dates.get('SPRING_START', f'{season}-01-01'))
+        season_end = min(end_dt, season_dates.get('POST_END', f'{season}-12-31'))
+
+        if season_start > season_end:
+            continue
 
-    return pyb.statcast_batter(start_dt, end_dt, player_id=player_id)
+        # Cut the season window at month boundaries
+        chunk_start = pd.Timestamp(season_start)
+        while chunk_start <= pd.Timestamp(season_end):
+            chunk_end = min(chunk_start + pd.offsets.MonthEnd(0), pd.Timestamp(season_end))
+            chunks.append((chunk_start.strftime('%Y-%m-%d'), chunk_end.strftime('%Y-%m-%d')))
+            chunk_start = chunk_end + timedelta(days=1)
+
+    return chunks
+
+def set_statcast_concurrency(max_downloads: int):
+    """
+    Set how many Statcast downloads this process may have in flight at once, across all
+    threads and players. Process pools split their overall budget between workers with this.
+
+    Args:
+    - max_downloads (int): Maximum number of concurrent Statcast requests (at least 1).
+    """
+    global _statcast_concurrency, _statcast_semaphore
+    _statcast_concurrency = max(1, int(max_downloads))
+    _statcast_semaphore = threading.BoundedSemaphore(_statcast_concurrency)
+
+def _fetch_savant_chunk(player_id: int, start_dt: str, end_dt: str) -> pd.DataFrame:
+    """Fetch one chunk of Statcast data, retrying with exponential backoff."""
+    for attempt in range(STATCAST_MAX_RETRIES):
+        try:
+            with _statcast_semaphore:
+                return pyb.statcast_batter(start_dt, end_dt, player_id=player_id)
+        except Exception as e:
+            if attempt == STATCAST_MAX_RETRIES - 1:
+                raise
+            delay = STATCAST_BACKOFF_SECONDS * 2 ** attempt
+            print(f"Statcast request {start_dt} - {end_dt} failed ({e}), retrying in {delay}s")
+            time.sleep(delay)
+
+def download_savant_data(player_id: int, date_ranges: list, max_workers: int = STATCAST_MAX_WORKERS) -> pd.DataFrame:
+    """
+    Download Statcast data for a batter concurrently, one month chunk per request.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - date_ranges (list): (start, end) date string tuples to download.
+    - max_workers (int): Maximum number of concurrent requests for this call; the process-wide
+      limit set with set_statcast_concurrency still applies.
+
+    Returns:
+    - pd.DataFrame: The chunks concatenated in date order with duplicate pitches removed,
+      compacted with compact_statcast.
+    """
+    chunks = [chunk for start_dt, end_dt in date_ranges
+              for chunk in split_savant_date_range(start_dt, end_dt)]
+    if not chunks:
+        return pd.DataFrame()
+
+    # executor.map keeps the results in chunk order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda chunk: _fetch_savant_chunk(player_id, *chunk), chunks))
+
+    df = pd.concat(results, ignore_index=True)
+
+    # Chunks can overlap at the boundaries, so drop pitches seen twice
+    pitch_key = ['game_pk', 'at_bat_number', 'pitch_number']
+    if set(pitch_key).issubset(df.columns):
+        return compact_statcast(df.drop_duplicates(subset=pitch_key, ignore_index=True))
+    return compact_statcast(df.drop_duplicates(ignore_index=True))
+
+def compact_statcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Project raw Statcast data to the columns the hitter metrics use, with narrow dtypes.
+
+    Keeps the STATCAST_COLUMNS present in the frame: events and description become
+    categoricals, the measurements float32 and the pitch keys small integers. The
+    game_date is normalized to a "YYYY-MM-DD" string. Already compact frames pass
+    through unchanged.
+
+    Args:
+    - df (pd.DataFrame): Raw (or already compact) Statcast data.
+
+    Returns:
+    - pd.DataFrame: The compact Statcast data.
+    """
+    if df.empty and df.columns.empty:
+        return df
+
+    columns = [col for col in STATCAST_COLUMNS if col in df.columns]
+    df = df[columns]
+    if 'game_date' in columns and pd.api.types.is_datetime64_any_dtype(df['game_date']):
+        df = df.assign(game_date=df['game_date'].dt.strftime('%Y-%m-%d'))
+
+    return df.astype({col: STATCAST_COLUMNS[col] for col in columns})
+
+def _league_statcast_path(season: int) -> str:
+    """Get the Arrow IPC file of a season's league store."""
+    return os.path.join(LEAGUE_STATCAST_DIR, f'{season}.arrow')
+
+def write_league_statcast(df: pd.DataFrame, season: int) -> str:
+    """
+    Write a season of league-wide Statcast data to the memory-mapped league store.
+
+    The pitches are compacted, sorted by batter then date and pitch, and written as an
+    uncompressed Arrow IPC file (so it can be memory-mapped). The index of where each
+    batter's rows start is stored in the file's schema metadata, so data and index are
+    always replaced together.
+
+    Args:
+    - df (pd.DataFrame): Raw Statcast data for every batter in the season.
+    - season (int): The season year.
+
+    Returns:
+    - str: The path of the written store.
+    """
+    df = compact_statcast(df).sort_values(
+        ['batter', 'game_date', 'game_pk', 'at_bat_number', 'pitch_number'], ignore_index=True)
+
+    # Batter i's rows are offsets[i]:offsets[i + 1]
+    batters, starts = np.unique(df['batter'].to_numpy(), return_index=True)
+    offsets = np.append(starts, len(df))
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({
+        **table.schema.metadata,
+        b'batters': batters.astype(np.int64).tobytes(),
+        b'offsets': offsets.astype(np.int64).tobytes()
+    })
+
+    data_path = _league_statcast_path(season)
+    os.makedirs(LEAGUE_STATCAST_DIR, exist_ok=True)
+    tmp_path = f'{data_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, data_path)
+
+    return data_path
+
+def download_league_statcast(season: int) -> str:
+    """
+    Download a full season of league-wide Statcast data into the league store.
+
+    Args:
+    - season (int): The season year.
+
+    Returns:
+    - str: The path of the written store.
+    """
+    season_dates = SEASON_DATES.get(season, {})
+    df = pyb.statcast(start_dt=season_dates.get('SPRING_START', f'{season}-01-01'),
+                      end_dt=season_dates.get('POST_END', f'{season}-12-31'))
+    return write_league_statcast(df, season)
+
+# Open league stores, keyed by season: (file identity, memory-mapped table, batters, offsets)
+_league_statcast = {}
+_league_statcast_lock = threading.Lock()
+
+def _open_league_statcast(season: int) -> tuple:
+    """Memory-map a season's league store and read its batter index, reopening it if the file was replaced."""
+    data_path = _league_statcast_path(season)
+    stat = os.stat(data_path)
+    identity = (stat.st_ino, stat.st_mtime_ns)
+
+    with _league_statcast_lock:
+        cached = _league_statcast.get(season)
+        if cached is None or cached[0] != identity:
+            # Reading from a memory map gives a table backed by the file, not by copies
+            table = pa.ipc.open_file(pa.memory_map(data_path, 'r')).read_all()
+            metadata = table.schema.metadata
+            batters = np.frombuffer(metadata[b'batters'], dtype=np.int64)
+            offsets = np.frombuffer(metadata[b'offsets'], dtype=np.int64)
+            _league_statcast[season] = (identity, table, batters, offsets)
+
+        return _league_statcast[season][1:]
+
+def get_league_statcast(player_id: int, season: int, start_dt: str = None, end_dt: str = None,
+                        as_pandas: bool = True):
+    """
+    Read a batter's pitches from the memory-mapped league store.
+
+    The batter's rows are located through the offset index and the date range by binary
+    search over their (sorted) dates, so only the returned slice is ever read from disk.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - season (int): The season year; the store must have been written for it.
+    - start_dt (str): The start date in "YYYY-MM-DD" format. Optional.
+    - end_dt (str): The end date in "YYYY-MM-DD" format. Optional.
+    - as_pandas (bool): Convert to a DataFrame. If False, return the zero-copy pyarrow.Table slice.
+
+    Returns:
+    - pd.DataFrame or pyarrow.Table: The batter's pitches in the range, as compact_statcast columns.
+    """
+    table, batters, offsets = _open_league_statcast(season)
+
+    i = np.searchsorted(batters, player_id)
+    if i == len(batters) or batters[i] != player_id:
+        rows = table.slice(0, 0)
+    else:
+        rows = table.slice(offsets[i], offsets[i + 1] - offsets[i])
+        dates = rows.column('game_date').to_numpy()
+        first = np.searchsorted(dates, start_dt, side='left') if start_dt else 0
+        last = np.searchsorted(dates, end_dt, side='right') if end_dt else len(dates)
+        rows = rows.slice(first, last - first)
+
+    return rows.to_pandas() if as_pandas else rows
+
+def _fetch_context_and_logo(player_id: int) -> tuple:
+    """Fetch the player context, then the team logo that depends on it."""
+    context = get_player_context(player_id)
+    return context, get_team_logo(player_id, context)
+
+def fetch_card_inputs(player_id: int, start_date: str, end_date: str, season: int = 2024, game_type: str = 'R') -> dict:
+    """
+    Fetch every input a batter card needs at the same time.
+
+    The headshot, player context (and team logo), game logs and Statcast data are
+    independent requests, so they are started together and the card waits only
+    as long as the slowest one. Statcast data is only brought up to date in the
+    pitch cache; the card reads its metrics from the cache's per-game aggregates.
+
+    Args:
+    - player_id (int): The unique player ID.
+    - start_date (str): Start date in "YYYY-MM-DD" format.
+    - end_date (str): End date in "YYYY-MM-DD" format.
+    - season (int): The season year.
+    - game_type (str): The game type for the game logs.
+
+    Returns:
+    - dict: The fetched 'headshot', 'context', 'team_logo' and 'game_logs'.
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        headshot = executor.submit(get_headshot, player_id)
+        context_and_logo = executor.submit(_fetch_context_and_logo, player_id)
+        game_logs = executor.submit(get_filtered_game_logs, player_id, start_date, end_date, season, game_type)
+        savant_cache = executor.submit(update_savant_cache, player_id, start_date, end_date)
+
+        context, team_logo = context_and_logo.result()
+        savant_cache.result()
+        return {
+            "headshot": headshot.result(),
+            "context": context,
+            "team_logo": team_logo,
+            "game_logs": game_logs.result()
+        }
 
 def get_savant_color(pct: float) -> tuple:
     """Get Baseball Savant style color for percentile"""
@@ -286,4 +1274,25 @@ def get_savant_color(pct: float) -> tuple:
             PERCENTILE_COLORS['gray'][i] + 
             (PERCENTILE_COLORS['red'][i] - PERCENTILE_COLORS['gray'][i]) * t 
             for i in range(3)
-        )
\ No newline at end of file
+        )
+
+# Baseball Savant colors at every 0.1 percentile from 0 to 100 (blue at 0, gray at 50, red at 100)
+SAVANT_COLOR_RESOLUTION = 0.1
+SAVANT_COLOR_LUT = np.array([get_savant_color(pct) for pct in np.linspace(0, 100, 1001)])
+
+def get_savant_colors(pcts) -> np.ndarray:
+    """
+    Vectorized get_savant_color: Baseball Savant style colors for an array of percentiles.
+
+    Percentiles are rounded to the nearest 0.1 and looked up in SAVANT_COLOR_LUT, which keeps
+    every channel within 1/255 of get_savant_color. Missing percentiles get the 50th percentile gray.
+
+    Args:
+    - pcts (array-like): Percentiles (0-100).
+
+    Returns:
+    - np.ndarray: One RGB row per percentile, shape (*pcts.shape, 3).
+    """
+    pcts = np.nan_to_num(np.asarray(pcts, dtype=float), nan=50)
+    idx = np.rint(np.clip(pcts, 0, 100) / SAVANT_COLOR_RESOLUTION).astype(np.intp)
+    return SAVANT_COLOR_LUT[idx]